@@ -5,17 +5,181 @@ Streamlit Web Interface for OpenAI Responses API
 A user-friendly web interface for generating structured responses using OpenAI's Responses API.
 """
 
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+import hashlib
+import html
 import os
 import sys
+import threading
+import time
 import streamlit as st
 import json
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
+
+# Add src to path for imports (Streamlit re-executes this module on every rerun)
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+# openai_responses is imported where it is used, so rendering the page
+# doesn't pay for importing the client stack until it is needed.
+if TYPE_CHECKING:
+    from openai_responses import OpenAIResponsesAPI, ResponseResponse, Tool
+
+# Widget options (module-level tuples so they aren't rebuilt on every rerun)
+MODELS = ("gpt-5", "gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo")
+GPT5_LEVELS = ("low", "medium", "high")
+RESPONSE_TYPES = ("email", "letter", "message", "response", "reply", "note")
+STYLES = ("professional", "casual", "formal", "friendly", "business")
+TONES = ("friendly", "polite", "assertive", "neutral", "enthusiastic", "sympathetic", "professional")
+LENGTHS = ("short", "medium", "long")
+TOOL_TYPES = ("hosted_tool", "function")
+TOOL_CHOICES = ("auto", "none")
+PARAM_TYPES = ("string", "number", "integer", "boolean", "array", "object")
+HOSTED_TOOL_OPTIONS = {
+    "file_search": "Search through files in your workspace",
+    "web_search_preview": "Search the web for current information",
+    "computer_use_preview": "Interact with your computer (file operations, etc.)",
+    "code_interpreter": "Execute and analyze code",
+    "image_generation": "Generate images using DALL-E"
+}
+HOSTED_TOOL_TYPES = frozenset({
+    "code_interpreter", "file_search", "web_search_preview", "web_search_preview_2025_03_11",
+    "image_generation", "mcp", "computer_use_preview"
+})
+
+# Seconds to wait on the API before the client retries
+REQUEST_TIMEOUT = 30
+
+# Limits shared by every session of this app process
+MAX_CONCURRENT_REQUESTS = 4
+TOKENS_PER_MINUTE = 30000
+
+# Context window per model, and the room left for the generated output
+MODEL_CAP = {
+    "gpt-5": 400000,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-3.5-turbo": 16385,
+}
+EXPECTED_OUTPUT_TOKENS = 4096
+CHARS_PER_TOKEN = 4
+
+
+@st.cache_resource(show_spinner=False)
+def _get_api(api_key: str) -> OpenAIResponsesAPI:
+    """Get a shared API client so its HTTP session is reused across reruns."""
+    from openai_responses import OpenAIResponsesAPI
+    
+    return OpenAIResponsesAPI(api_key=api_key, timeout=REQUEST_TIMEOUT)
+
+
+class _RequestGate:
+    """Bounds concurrent API calls and the tokens used per rolling minute."""
+    
+    def __init__(self, max_concurrent: int, tokens_per_minute: int):
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._tokens_per_minute = tokens_per_minute
+        self._usage = collections.deque()  # (timestamp, tokens)
+        self._lock = threading.Lock()
+    
+    def _wait_for_budget(self):
+        """Block until the last minute's token usage is under the limit."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._usage and now - self._usage[0][0] >= 60:
+                    self._usage.popleft()
+                if sum(tokens for _, tokens in self._usage) < self._tokens_per_minute:
+                    return
+                wait = 60 - (now - self._usage[0][0])
+            time.sleep(wait)
+    
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one of the concurrent request slots once token budget is available."""
+        self._wait_for_budget()
+        with self._slots:
+            yield
+    
+    def record(self, tokens: int):
+        """Record the tokens used by a completed request."""
+        with self._lock:
+            self._usage.append((time.monotonic(), tokens))
+
+
+@st.cache_resource(show_spinner=False)
+def _request_gate() -> _RequestGate:
+    """Get the request gate shared across sessions and reruns."""
+    return _RequestGate(MAX_CONCURRENT_REQUESTS, TOKENS_PER_MINUTE)
+
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Page styles: response containers and the black clear-conversation button.
+# Response containers are keyed "response_...", which Streamlit adds to the
+# container's classes as "st-key-response_..."
+_CSS = """
+/* Style only the response content containers */
+[class*="st-key-response_"] {
+    background-color: #f8f9fa;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border-left: 4px solid #007bff;
+    margin: 1rem 0;
+}
 
-from openai_responses import OpenAIResponsesAPI, ResponseFormat, Tool, ToolFunction
-from openai_responses.exceptions import APIError, AuthenticationError
+/* Style headings in response content */
+[class*="st-key-response_"] h1, 
+[class*="st-key-response_"] h2, 
+[class*="st-key-response_"] h3 {
+    color: #2c3e50;
+    margin-top: 1.5rem;
+    margin-bottom: 0.5rem;
+}
+
+/* Style lists in response content */
+[class*="st-key-response_"] ul, 
+[class*="st-key-response_"] ol {
+    margin-left: 1.5rem;
+}
+
+[class*="st-key-response_"] li {
+    margin-bottom: 0.25rem;
+}
+
+/* Style blockquotes in response content */
+[class*="st-key-response_"] blockquote {
+    border-left: 4px solid #6c757d;
+    padding-left: 1rem;
+    margin: 1rem 0;
+    color: #6c757d;
+}
+
+/* Style code in response content */
+[class*="st-key-response_"] code {
+    background-color: #e9ecef;
+    padding: 0.2rem 0.4rem;
+    border-radius: 0.25rem;
+    font-family: 'Courier New', monospace;
+}
+
+/* Style the clear conversation button to be black */
+div[data-testid="stButton"] button[kind="secondary"] {
+    background-color: #000000 !important;
+    color: white !important;
+    border-color: #000000 !important;
+    font-weight: bold !important;
+}
+
+div[data-testid="stButton"] button[kind="secondary"]:hover {
+    background-color: #333333 !important;
+    border-color: #333333 !important;
+}
+"""
 
 
 def setup_page():
@@ -27,74 +191,59 @@ def setup_page():
         initial_sidebar_state="expanded"
     )
     
-    # Add custom CSS for better markdown rendering
-    st.markdown("""
-    <style>
-    /* Style only the response content markdown */
-    .response-markdown {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #007bff;
-        margin: 1rem 0;
-    }
-    
-    /* Style headings in response content */
-    .response-markdown h1, 
-    .response-markdown h2, 
-    .response-markdown h3 {
-        color: #2c3e50;
-        margin-top: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    /* Style lists in response content */
-    .response-markdown ul, 
-    .response-markdown ol {
-        margin-left: 1.5rem;
-    }
-    
-    .response-markdown li {
-        margin-bottom: 0.25rem;
-    }
-    
-    /* Style blockquotes in response content */
-    .response-markdown blockquote {
-        border-left: 4px solid #6c757d;
-        padding-left: 1rem;
-        margin: 1rem 0;
-        color: #6c757d;
-    }
-    
-    /* Style code in response content */
-    .response-markdown code {
-        background-color: #e9ecef;
-        padding: 0.2rem 0.4rem;
-        border-radius: 0.25rem;
-        font-family: 'Courier New', monospace;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Streamlit drops elements that a rerun does not emit again, so the
+    # styles are sent on every run, as one element
+    st.markdown(f"<style>{_CSS}</style>", unsafe_allow_html=True)
     
     st.title("🤖 OpenAI Responses API Interface")
     st.markdown("Generate structured responses using OpenAI's Responses API with support for tools and custom formatting.")
 
 
+def _rerun_app_if_changed(name: str, shown) -> None:
+    """
+    Rerun the whole app when a fragment changes what the settings panel shows.
+    
+    A widget inside a fragment only reruns that fragment, which would leave the
+    "Current Settings" summary rendered by main() showing the old values.
+    """
+    key = f"_shown_{name}"
+    previous = st.session_state.get(key)
+    st.session_state[key] = shown
+    if previous is not None and previous != shown:
+        st.rerun(scope="app")
+
+
+@st.fragment
 def create_sidebar():
-    """Create the sidebar with configuration options."""
-    st.sidebar.header("⚙️ Configuration")
+    """Create the sidebar with configuration options.
+    
+    Runs as a fragment so changing a setting only reruns the sidebar, unless
+    it changes the settings summary. The resulting configuration is stored in
+    ``st.session_state.config``.
+    """
+    st.header("⚙️ Configuration")
     
     # API Key input
-    api_key = st.sidebar.text_input(
+    api_key = st.text_input(
         "OpenAI API Key",
         type="password",
         help="Enter your OpenAI API key. You can also set it as OPENAI_API_KEY environment variable."
     )
     
+    # Drop cached clients (e.g. after rotating the API key)
+    if st.button("Clear client", help="Discard the cached API client and its connections."):
+        _get_api.clear()
+    
+    ignore_cache = st.checkbox(
+        "Ignore cache",
+        value=False,
+        help="Always call the API instead of reusing a cached response for identical requests."
+    )
+    
     # Model selection
-    model = st.sidebar.selectbox(
+    model = st.selectbox(
         "Model",
-        ["gpt-5","gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"],
+        MODELS,
         index=0,
         help="Select the OpenAI model to use for generation."
     )
@@ -102,33 +251,34 @@ def create_sidebar():
     # Conditional parameters based on model
     if model == "gpt-5":
         # GPT-5 specific parameters
-        st.sidebar.subheader("GPT-5 Parameters")
+        st.subheader("GPT-5 Parameters")
         
-        effort = st.sidebar.selectbox(
+        effort = st.selectbox(
             "Effort",
-            ["low", "medium", "high"],
+            GPT5_LEVELS,
             index=1,
             help="Controls how much effort the model puts into generating the response."
         )
         
-        verbosity = st.sidebar.selectbox(
+        verbosity = st.selectbox(
             "Verbosity",
-            ["low", "medium", "high"],
+            GPT5_LEVELS,
             index=1,
             help="Controls the level of detail in the response."
         )
         
-        return {
+        st.session_state.config = {
             "api_key": api_key,
+            "ignore_cache": ignore_cache,
             "model": model,
             "effort": effort,
             "verbosity": verbosity
         }
     else:
         # Traditional parameters for other models
-        st.sidebar.subheader("Generation Parameters")
+        st.subheader("Generation Parameters")
         
-        temperature = st.sidebar.slider(
+        temperature = st.slider(
             "Temperature",
             min_value=0.0,
             max_value=2.0,
@@ -137,7 +287,7 @@ def create_sidebar():
             help="Controls randomness. Lower values are more deterministic, higher values more creative."
         )
         
-        top_p = st.sidebar.slider(
+        top_p = st.slider(
             "Top-p",
             min_value=0.0,
             max_value=1.0,
@@ -146,16 +296,52 @@ def create_sidebar():
             help="Controls diversity via nucleus sampling. Lower values focus on most likely tokens."
         )
         
-        return {
+        st.session_state.config = {
             "api_key": api_key,
+            "ignore_cache": ignore_cache,
             "model": model,
             "temperature": temperature,
             "top_p": top_p
         }
+    
+    config = st.session_state.config
+    _rerun_app_if_changed("config", (
+        bool(api_key),
+        *(value for name, value in config.items() if name not in ("api_key", "ignore_cache")),
+    ))
 
 
+@functools.lru_cache(maxsize=32)
+def _hosted_tool(tool_id: str) -> Tool:
+    """Build a hosted tool once per tool ID."""
+    from openai_responses import Tool
+    
+    return Tool(type=tool_id)
+
+
+@functools.lru_cache(maxsize=32)
+def _function_tool(name: str, description: str, parameters_json: str) -> Tool:
+    """Build a function tool once per name, description and parameter schema."""
+    from openai_responses import Tool, ToolFunction
+    
+    return Tool(
+        type="function",
+        function=ToolFunction(
+            name=name,
+            description=description,
+            parameters=json.loads(parameters_json)
+        )
+    )
+
+
+@st.fragment
 def create_tools_section():
-    """Create the tools configuration section."""
+    """Create the tools configuration section.
+    
+    Runs as a fragment so editing tools does not rerun the whole app unless
+    the tool count or tool choice shown in the settings summary changes; the
+    result is stored in ``st.session_state.tools`` and ``tool_choice``.
+    """
     st.header("🔧 Tools Configuration")
     
     # Enable tools (default to True)
@@ -166,12 +352,14 @@ def create_tools_section():
     )
     
     if not enable_tools:
-        return None, None
+        st.session_state.tools, st.session_state.tool_choice = None, None
+        _rerun_app_if_changed("tools", (0, None))
+        return
     
     # Tool type selection (default to hosted_tool)
     tool_type = st.selectbox(
         "Tool Type",
-        ["hosted_tool", "function"],
+        TOOL_TYPES,
         index=0,
         help="Choose between hosted tools (OpenAI's pre-built tools) or function tools (your custom functions)."
     )
@@ -183,33 +371,26 @@ def create_tools_section():
         # Hosted tool configuration (OpenAI's pre-built tools)
         st.subheader("OpenAI Hosted Tools")
         
-        hosted_tool_options = {
-            "file_search": "Search through files in your workspace",
-            "web_search_preview": "Search the web for current information",
-            "computer_use_preview": "Interact with your computer (file operations, etc.)",
-            "code_interpreter": "Execute and analyze code",
-            "image_generation": "Generate images using DALL-E"
-        }
-        
         selected_hosted_tools = st.multiselect(
             "Select Hosted Tools",
-            options=list(hosted_tool_options.keys()),
+            options=list(HOSTED_TOOL_OPTIONS),
             default=["web_search_preview"],
             help="Choose which OpenAI hosted tools to make available to the model."
         )
         
         # Create hosted tool objects
         for tool_id in selected_hosted_tools:
-            tool = Tool(type=tool_id)
-            tools.append(tool)
+            tools.append(_hosted_tool(tool_id))
         
         # Show selected tools info
         if selected_hosted_tools:
             st.subheader("Selected Hosted Tools")
-            for tool_id in selected_hosted_tools:
-                with st.expander(f"📋 {tool_id}"):
-                    st.write(f"**Description:** {hosted_tool_options[tool_id]}")
-                    st.write(f"**Tool ID:** `{tool_id}`")
+            st.markdown("".join(
+                f"<details><summary>📋 {tool_id}</summary>"
+                f"<p><b>Description:</b> {HOSTED_TOOL_OPTIONS[tool_id]}<br>"
+                f"<b>Tool ID:</b> <code>{tool_id}</code></p></details>"
+                for tool_id in selected_hosted_tools
+            ), unsafe_allow_html=True)
     
     elif tool_type == "function":
         # Function tool configuration (your custom functions)
@@ -233,132 +414,104 @@ def create_tools_section():
         st.subheader("Function Parameters")
         st.write("Define the JSON schema for your function parameters:")
         
-        # Simple parameter builder
-        num_params = st.number_input(
-            "Number of Parameters",
-            min_value=1,
-            max_value=10,
-            value=1,
-            help="How many parameters does your function need?"
+        # One editable table instead of a set of widgets per parameter;
+        # enum values are comma-separated and only apply to strings
+        rows = st.data_editor(
+            [{
+                "name": "param_1",
+                "type": "string",
+                "description": "Description for parameter 1",
+                "required": True,
+                "enum": ""
+            }],
+            num_rows="dynamic",
+            key="function_params",
+            column_config={
+                "name": st.column_config.TextColumn("Name", required=True),
+                "type": st.column_config.SelectboxColumn("Type", options=PARAM_TYPES, required=True),
+                "description": st.column_config.TextColumn("Description"),
+                "required": st.column_config.CheckboxColumn("Required"),
+                "enum": st.column_config.TextColumn("Enum Values")
+            }
         )
         
+        named_rows = [row for row in rows if row.get("name")]
+        properties = {}
+        for row in named_rows:
+            param = {
+                "type": row.get("type") or "string",
+                "description": row.get("description") or ""
+            }
+            if param["type"] == "string" and row.get("enum"):
+                # Skip blanks left by stray or trailing commas
+                param["enum"] = list(filter(None, map(str.strip, row["enum"].split(","))))
+            properties[row["name"]] = param
+        
         parameters = {
             "type": "object",
-            "properties": {},
-            "required": []
+            "properties": properties,
+            "required": [row["name"] for row in named_rows if row.get("required")]
         }
         
-        for i in range(num_params):
-            st.write(f"**Parameter {i+1}:**")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                param_name = st.text_input(
-                    f"Parameter Name {i+1}",
-                    value=f"param_{i+1}",
-                    key=f"param_name_{i}"
-                )
-                
-                param_type = st.selectbox(
-                    f"Parameter Type {i+1}",
-                    ["string", "number", "integer", "boolean", "array", "object"],
-                    key=f"param_type_{i}"
-                )
-                
-                is_required = st.checkbox(
-                    f"Required {i+1}",
-                    value=True,
-                    key=f"required_{i}"
-                )
-            
-            with col2:
-                param_desc = st.text_input(
-                    f"Parameter Description {i+1}",
-                    value=f"Description for parameter {i+1}",
-                    key=f"param_desc_{i}"
-                )
-                
-                # Add enum support for strings
-                if param_type == "string":
-                    use_enum = st.checkbox(
-                        f"Use Enum Values {i+1}",
-                        key=f"use_enum_{i}"
-                    )
-                    if use_enum:
-                        enum_values = st.text_input(
-                            f"Enum Values (comma-separated) {i+1}",
-                            value="option1,option2,option3",
-                            key=f"enum_values_{i}"
-                        )
-                        enum_list = [v.strip() for v in enum_values.split(",")]
-                        parameters["properties"][param_name] = {
-                            "type": param_type,
-                            "description": param_desc,
-                            "enum": enum_list
-                        }
-                    else:
-                        parameters["properties"][param_name] = {
-                            "type": param_type,
-                            "description": param_desc
-                        }
-                else:
-                    parameters["properties"][param_name] = {
-                        "type": param_type,
-                        "description": param_desc
-                    }
-                
-                if is_required:
-                    parameters["required"].append(param_name)
-            
-            st.divider()
-        
         # Create tool
         if function_name and function_description:
-            tool = Tool(
-                type="function",
-                function=ToolFunction(
-                    name=function_name,
-                    description=function_description,
-                    parameters=parameters
-                )
+            tool = _function_tool(
+                function_name,
+                function_description,
+                json.dumps(parameters, sort_keys=True)
             )
             tools.append(tool)
             
             # Show the generated JSON schema
             st.subheader("Generated JSON Schema")
-            with st.expander("View Function Schema"):
-                st.json(parameters)
+            st.markdown(
+                "<details><summary>View Function Schema</summary>"
+                f"<pre>{html.escape(json.dumps(parameters, indent=2))}</pre></details>",
+                unsafe_allow_html=True
+            )
     
     # Tool choice configuration
     st.subheader("Tool Choice")
     tool_choice = st.selectbox(
         "Tool Choice",
-        ["auto", "none"],
+        TOOL_CHOICES,
         help="'auto' lets the model decide when to use tools, 'none' prevents tool usage."
     )
     
-    # Show tool configuration summary
+    # Show tool configuration summary as a single element
     if tools:
         st.subheader("📋 Tool Configuration Summary")
+        parts = []
         for i, tool in enumerate(tools):
-            with st.expander(f"Tool {i+1}: {tool.type}"):
-                if tool.type in ["code_interpreter", "file_search", "web_search_preview", "web_search_preview_2025_03_11", "image_generation", "mcp", "computer_use_preview"]:
-                    st.write(f"**Type:** OpenAI Hosted Tool")
-                    st.write(f"**Tool ID:** `{tool.type}`")
-                    if tool.type in hosted_tool_options:
-                        st.write(f"**Description:** {hosted_tool_options[tool.type]}")
-                else:
-                    st.write(f"**Type:** Function Tool")
-                    st.write(f"**Function Name:** `{tool.function.name}`")
-                    st.write(f"**Description:** {tool.function.description}")
-                    st.write("**Parameters:**")
-                    st.json(tool.function.parameters)
-    
-    return tools, tool_choice
+            parts.append(f"<details><summary>Tool {i+1}: {tool.type}</summary><p>")
+            if tool.type in HOSTED_TOOL_TYPES:
+                parts.append(f"<b>Type:</b> OpenAI Hosted Tool<br><b>Tool ID:</b> <code>{tool.type}</code>")
+                if tool.type in HOSTED_TOOL_OPTIONS:
+                    parts.append(f"<br><b>Description:</b> {HOSTED_TOOL_OPTIONS[tool.type]}")
+                parts.append("</p>")
+            else:
+                parts.append(
+                    f"<b>Type:</b> Function Tool<br>"
+                    f"<b>Function Name:</b> <code>{html.escape(tool.function.name)}</code><br>"
+                    f"<b>Description:</b> {html.escape(tool.function.description)}<br>"
+                    f"<b>Parameters:</b></p>"
+                    f"<pre>{html.escape(json.dumps(tool.function.parameters, indent=2))}</pre>"
+                )
+            parts.append("</details>")
+        st.markdown("".join(parts), unsafe_allow_html=True)
+    
+    st.session_state.tools, st.session_state.tool_choice = tools, tool_choice
+    _rerun_app_if_changed("tools", (len(tools), tool_choice))
 
 
+@st.fragment
 def create_response_format_section():
-    """Create the response format configuration section."""
+    """Create the response format configuration section.
+    
+    Runs as a fragment; every field appears in the settings summary, so a
+    change reruns the app. The selected format is stored in
+    ``st.session_state.response_format``.
+    """
     st.header("📝 Response Format")
     
     col1, col2 = st.columns(2)
@@ -366,21 +519,21 @@ def create_response_format_section():
     with col1:
         response_type = st.selectbox(
             "Response Type",
-            ["email", "letter", "message", "response", "reply", "note"],
+            RESPONSE_TYPES,
             index=3,  # "response" is at index 3
             help="Type of response to generate."
         )
         
         style = st.selectbox(
             "Style",
-            ["professional", "casual", "formal", "friendly", "business"],
+            STYLES,
             index=1,  # "casual" is at index 1
             help="Writing style for the response."
         )
         
         length = st.selectbox(
             "Length",
-            ["short", "medium", "long"],
+            LENGTHS,
             index=0,  # "short" is at index 0
             help="Desired length of the response."
         )
@@ -388,7 +541,7 @@ def create_response_format_section():
     with col2:
         tone = st.selectbox(
             "Tone",
-            ["friendly", "polite", "assertive", "neutral", "enthusiastic", "sympathetic", "professional"],
+            TONES,
             index=3,  # "neutral" is at index 3
             help="Tone of the response."
         )
@@ -399,43 +552,38 @@ def create_response_format_section():
             help="Language code for the response (e.g., 'en' for English)."
         )
     
-    return {
+    st.session_state.response_format = {
         "type": response_type,
         "style": style,
         "tone": tone,
         "length": length,
         "language": language
     }
+    _rerun_app_if_changed("response_format", tuple(st.session_state.response_format.values()))
+
+
+def _clear_conversation():
+    """Reset the conversation context (button callback, runs before the rerun)."""
+    st.session_state.conversation_history.clear()
+    st.session_state.last_response = None
+    st.session_state.last_error = None
+    st.session_state.last_warning = None
+    st.session_state.last_sig = None
 
 
 def create_prompt_section():
     """Create the prompt input section."""
     st.header("Prompt")
     
-    # Add custom CSS for black X button
-    st.markdown("""
-    <style>
-    /* Style the clear conversation button to be black */
-    div[data-testid="stButton"] button[kind="secondary"] {
-        background-color: #000000 !important;
-        color: white !important;
-        border-color: #000000 !important;
-        font-weight: bold !important;
-    }
-    
-    div[data-testid="stButton"] button[kind="secondary"]:hover {
-        background-color: #333333 !important;
-        border-color: #333333 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
     
     # Create a row with prompt input and clear button
     col1, col2 = st.columns([20, 1])
     
     with col1:
-        prompt = st.text_area(
+        # Bound to st.session_state.prompt
+        st.text_area(
             "Enter your prompt",
+            key="prompt",
             height=150,
             placeholder="Describe what kind of response you want to generate. For example: 'Write an email declining a meeting request due to a scheduling conflict'",
             help="Describe the response you want to generate. Be specific about the context and requirements."
@@ -447,58 +595,164 @@ def create_prompt_section():
         st.write("")  # More spacing
         
         # Clear conversation button with black X and styling
-        if st.button(
+        st.button(
             "✕", 
             help="Clear conversation context", 
             key="clear_conversation",
+            on_click=_clear_conversation,
             use_container_width=True,
             type="secondary"
-        ):
-            st.session_state.conversation_history = []
-            st.session_state.last_response = None
-            st.session_state.last_error = None
-            st.rerun()
-    
-    return prompt
+        )
+
+
+class _CacheMiss(Exception):
+    """Raised by _response_cache when no response is cached for a request."""
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _response_cache(
+    api_key_hash: str,
+    prompt: str,
+    model: str,
+    temperature: Optional[float],
+    top_p: Optional[float],
+    effort: Optional[str],
+    verbosity: Optional[str],
+    fmt_key: tuple,
+    tools_json: Optional[str],
+    tool_choice: Optional[str],
+    previous_response_id: Optional[str],
+    _response_data: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Cache of response fields keyed by the request parameters.
+    
+    Called without ``_response_data`` this is a lookup that raises _CacheMiss
+    (exceptions are never cached). Called with ``_response_data`` (which is
+    not part of the key) on a miss, it stores that dict for the request.
+    """
+    if _response_data is None:
+        raise _CacheMiss
+    return _response_data
+
+
+def _stream_response(api_key: str, prompt: str, response_format: Dict[str, Any], config: Dict[str, Any], tools: Optional[List[Tool]], tool_choice: Optional[str], previous_response_id: Optional[str]) -> ResponseResponse:
+    """Stream a new response into the page and return the completed response."""
+    from openai_responses import ResponseFormat
+    from openai_responses.exceptions import APIError
+    
+    # Get the cached API client
+    api = _get_api(api_key)
+    
+    # Reuse the validated format object for these options
+    format_obj = ResponseFormat.get(**response_format)
+    
+    # Prepare parameters based on model
+    kwargs = {
+        "prompt": prompt,
+        "response_format": format_obj,
+        "model": config["model"],
+        "tools": tools,
+        "tool_choice": tool_choice,
+        "previous_response_id": previous_response_id
+    }
+    # GPT-5 uses effort and verbosity; other models use temperature and top_p
+    if config["model"] == "gpt-5":
+        kwargs["effort"] = config.get("effort")
+        kwargs["verbosity"] = config.get("verbosity")
+    else:
+        kwargs["temperature"] = config.get("temperature")
+        kwargs["top_p"] = config.get("top_p")
+    stream = api.generate_response_stream(**kwargs)
+    
+    # Render deltas into the same bordered container the final response uses
+    placeholder = st.empty()
+    placeholder.info("Generating response...")
+    chunks = []
+    text = None
+    with stream:
+        for delta in stream:
+            chunks.append(delta)
+            if text is None:
+                # Container keys must be unique per run, so it is created once
+                with placeholder.container(border=True, key="response_stream"):
+                    text = st.empty()
+            text.markdown("".join(chunks))
+    
+    if stream.response is None:
+        raise APIError("Stream ended before the response completed.")
+    return stream.response
+
+
+def _settings_signature(prompt: str, response_format: Dict[str, Any], config: Dict[str, Any], tools: Optional[List[Tool]], tool_choice: Optional[str]) -> int:
+    """Hash everything that affects a generation, so an unchanged request can be skipped."""
+    tools_key = tuple(
+        json.dumps(tool.model_dump(exclude_none=True), sort_keys=True) for tool in tools
+    ) if tools else None
+    return hash((
+        prompt,
+        tuple(sorted(config.items())),
+        tuple(sorted(response_format.items())),
+        tools_key,
+        tool_choice,
+    ))
+
+
+def _fit_prompt(prompt: str, model: str) -> Tuple[str, Optional[str]]:
+    """
+    Truncate the prompt so it and the expected output fit the model's context window.
+    
+    Returns the prompt to send and a warning if it had to be truncated.
+    """
+    max_chars = (MODEL_CAP[model] - EXPECTED_OUTPUT_TOKENS) * CHARS_PER_TOKEN
+    if len(prompt) <= max_chars:
+        return prompt, None
+    warning = (
+        f"Prompt is about {len(prompt) // CHARS_PER_TOKEN:,} tokens, more than {model} can take; "
+        f"it was truncated to about {max_chars // CHARS_PER_TOKEN:,} tokens."
+    )
+    return prompt[:max_chars], warning
 
 
 def generate_response(api_key: str, prompt: str, response_format: Dict[str, Any], config: Dict[str, Any], tools: Optional[List[Tool]] = None, tool_choice: Optional[str] = None, previous_response_id: Optional[str] = None):
-    """Generate a response using the API."""
+    """Generate a response, streaming it unless an identical request is cached."""
+    from openai_responses import ResponseResponse
+    from openai_responses.exceptions import APIError, AuthenticationError
+    
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI(
-            api_key=api_key or os.getenv("OPENAI_API_KEY"),
-            timeout=30
+        if config.get("ignore_cache"):
+            _response_cache.clear()
+        
+        # Convert unhashable inputs into stable cache keys
+        fmt_key = tuple(sorted(response_format.items()))
+        tools_json = json.dumps(
+            [tool.model_dump(exclude_none=True) for tool in tools], sort_keys=True
+        ) if tools else None
+        cache_key = (
+            # Responses are per account, but the key itself is never a cache key
+            hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest(),
+            prompt,
+            config["model"],
+            config.get("temperature"),
+            config.get("top_p"),
+            config.get("effort"),
+            config.get("verbosity"),
+            fmt_key,
+            tools_json,
+            tool_choice,
+            previous_response_id,
         )
         
-        # Create response format object
-        format_obj = ResponseFormat(**response_format)
-        
-        # Prepare parameters based on model
-        if config["model"] == "gpt-5":
-            # GPT-5 uses effort and verbosity
-            response = api.generate_response(
-                prompt=prompt,
-                response_format=format_obj,
-                model=config["model"],
-                tools=tools,
-                tool_choice=tool_choice,
-                previous_response_id=previous_response_id,
-                effort=config.get("effort"),
-                verbosity=config.get("verbosity")
-            )
-        else:
-            # Traditional models use temperature and top_p
-            response = api.generate_response(
-                prompt=prompt,
-                response_format=format_obj,
-                model=config["model"],
-                temperature=config.get("temperature"),
-                top_p=config.get("top_p"),
-                tools=tools,
-                tool_choice=tool_choice,
-                previous_response_id=previous_response_id
-            )
+        try:
+            return ResponseResponse(**_response_cache(*cache_key)), None
+        except _CacheMiss:
+            pass
+        
+        gate = _request_gate()
+        with gate.slot():
+            response = _stream_response(api_key, prompt, response_format, config, tools, tool_choice, previous_response_id)
+        gate.record(response.total_tokens)
+        _response_cache(*cache_key, _response_data=response.model_dump())
         
         return response, None
         
@@ -510,8 +764,12 @@ def generate_response(api_key: str, prompt: str, response_format: Dict[str, Any]
         return None, f"Unexpected error: {e}"
 
 
+@st.fragment
 def display_response(response, error: Optional[str] = None):
-    """Display the generated response or error."""
+    """Display the generated response or error.
+    
+    Runs as a fragment so toggling the raw-text view does not rerun the app.
+    """
     st.header("Generated Response")
     
     if error:
@@ -539,20 +797,12 @@ def display_response(response, error: Optional[str] = None):
         # Use markdown to render the content properly
         if response.content:
             if show_raw:
-                st.text_area(
-                    "Raw Response Text",
-                    value=response.content,
-                    height=300,
-                    disabled=True,
-                    key="response_content_raw"
-                )
+                # Static code block; it has a built-in copy button
+                st.code(response.content, language=None)
             else:
-                # Render markdown with custom styling
-                st.markdown(f"""
-                <div class="response-markdown">
-                {response.content}
-                </div>
-                """, unsafe_allow_html=True)
+                # Model output is rendered as plain markdown, never as raw HTML
+                with st.container(border=True, key="response_content"):
+                    st.markdown(response.content)
         else:
             st.info("No content generated.")
         
@@ -561,12 +811,12 @@ def display_response(response, error: Optional[str] = None):
             st.subheader("🔧 Tool Calls")
             for i, tool_call in enumerate(response.tool_calls):
                 with st.expander(f"Tool Call {i+1}: {tool_call.id}"):
-                    st.json({
+                    st.code(json.dumps({
                         "id": tool_call.id,
                         "type": tool_call.type,
                         "function": tool_call.function,
                         "hosted_tool": tool_call.hosted_tool
-                    })
+                    }, indent=2, default=str), language="json")
         
         # Display metadata
         col1, col2, col3 = st.columns(3)
@@ -582,17 +832,43 @@ def display_response(response, error: Optional[str] = None):
         
         # Display additional info
         with st.expander("📊 Response Details"):
-            st.json({
+            st.code(json.dumps({
                 "id": response.id,
                 "model": response.model,
                 "status": response.status,
                 "finish_reason": response.finish_reason,
                 "created_at": response.created_at
-            })
+            }, indent=2, default=str), language="json")
+
+
+@st.fragment
+def display_conversation_history():
+    """Display previous exchanges of the current conversation."""
+    if not st.session_state.conversation_history:
+        return
+    
+    st.subheader("📜 Conversation History")
+    
+    # Show warning if conversation is getting long
+    if len(st.session_state.conversation_history) >= 8:
+        st.warning("⚠️ Conversation history is getting long. Consider starting a new conversation for better performance.")
+    
+    # Model output is rendered as plain markdown, never as raw HTML. This
+    # costs an expander per exchange: a single HTML element would be fewer
+    # deltas, but it can only show the model's markdown escaped or unsafe
+    for i, (user_msg, assistant_msg) in enumerate(st.session_state.conversation_history):
+        with st.expander(f"Exchange {i+1}"):
+            st.markdown("**👤 You:**")
+            st.text(user_msg)
+            st.markdown("**🤖 Assistant:**")
+            with st.container(border=True, key=f"response_history_{i}"):
+                st.markdown(assistant_msg)
 
 
 def main():
     """Main Streamlit application."""
+    from openai_responses.config import get_api_key
+    
     setup_page()
     
     # Initialize session state
@@ -604,117 +880,121 @@ def main():
         st.session_state.last_response = None
     if "last_error" not in st.session_state:
         st.session_state.last_error = None
+    if "last_warning" not in st.session_state:
+        st.session_state.last_warning = None
     if "conversation_history" not in st.session_state:
-        st.session_state.conversation_history = []
+        # Only the last 10 exchanges are kept for display
+        st.session_state.conversation_history = collections.deque(maxlen=10)
+    if "last_sig" not in st.session_state:
+        st.session_state.last_sig = None
     
     # Create sidebar
-    config = create_sidebar()
+    with st.sidebar:
+        create_sidebar()
+    config = st.session_state.config
+    # The sidebar key wins over the environment key
+    api_key = config["api_key"] or get_api_key()
     
     # Create main content
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Display conversation history
-        if st.session_state.conversation_history:
-            st.subheader("📜 Conversation History")
-            
-            # Show warning if conversation is getting long
-            if len(st.session_state.conversation_history) >= 8:
-                st.warning("⚠️ Conversation history is getting long. Consider starting a new conversation for better performance.")
-            
-            for i, (user_msg, assistant_msg) in enumerate(st.session_state.conversation_history):
-                with st.expander(f"Exchange {i+1}", expanded=False):
-                    st.write("**👤 You:**")
-                    st.write(user_msg)
-                    st.write("**🤖 Assistant:**")
-                    st.markdown(f"""
-                    <div class="response-markdown">
-                    {assistant_msg}
-                    </div>
-                    """, unsafe_allow_html=True)
+        display_conversation_history()
         
         # Prompt input
-        prompt = create_prompt_section()
+        create_prompt_section()
+        prompt = st.session_state.prompt
         
         # Tools configuration
-        tools, tool_choice = create_tools_section()
+        create_tools_section()
+        tools, tool_choice = st.session_state.tools, st.session_state.tool_choice
         
         # Response format configuration
-        response_format = create_response_format_section()
+        create_response_format_section()
+        response_format = st.session_state.response_format
         
         # Generate button
         if st.button("🚀 Generate Response", type="primary", use_container_width=True):
+            settings_sig = _settings_signature(prompt, response_format, config, tools, tool_choice)
+            
             if not prompt.strip():
                 st.error("Please enter a prompt.")
-            elif not (config["api_key"] or os.getenv("OPENAI_API_KEY")):
+            elif not api_key:
                 st.error("Please provide an OpenAI API key.")
+            elif (
+                settings_sig == st.session_state.last_sig
+                and st.session_state.last_response
+                and not config.get("ignore_cache")
+            ):
+                # Nothing changed since the last generation; keep showing it
+                pass
             else:
-                with st.spinner("Generating response..."):
-                    # Get previous response ID for conversation continuity
-                    previous_response_id = None
-                    if st.session_state.last_response:
-                        previous_response_id = st.session_state.last_response.id
-                    
-                    response, error = generate_response(
-                        api_key=config["api_key"],
-                        prompt=prompt,
-                        response_format=response_format,
-                        config=config,
-                        tools=tools,
-                        tool_choice=tool_choice,
-                        previous_response_id=previous_response_id
-                    )
-                    
-                    if response and not error:
-                        # Add to conversation history for display purposes
-                        st.session_state.conversation_history.append((prompt, response.content))
-                        # Limit history to last 10 exchanges for display
-                        if len(st.session_state.conversation_history) > 10:
-                            st.session_state.conversation_history = st.session_state.conversation_history[-10:]
-                    
-                    st.session_state.last_response = response
-                    st.session_state.last_error = error
-                    st.rerun()
+                # Get previous response ID for conversation continuity
+                previous_response_id = None
+                if st.session_state.last_response:
+                    previous_response_id = st.session_state.last_response.id
+                
+                # Kept in session state, since the rerun below would clear a warning shown now
+                sent_prompt, st.session_state.last_warning = _fit_prompt(prompt, config["model"])
+                
+                response, error = generate_response(
+                    api_key=api_key,
+                    prompt=sent_prompt,
+                    response_format=response_format,
+                    config=config,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    previous_response_id=previous_response_id
+                )
+                
+                if response and not error:
+                    # Add to conversation history for display purposes
+                    st.session_state.conversation_history.append((sent_prompt, response.content))
+                
+                st.session_state.last_response = response
+                st.session_state.last_error = error
+                st.session_state.last_sig = settings_sig if response else None
+                st.rerun()
     
     # Always display the last response if it exists
+    if st.session_state.last_warning:
+        st.warning(st.session_state.last_warning)
     if st.session_state.last_response or st.session_state.last_error:
         display_response(st.session_state.last_response, st.session_state.last_error)
     
     with col2:
         # Display current configuration
-        st.header("⚙️ Current Settings")
-        
-        st.subheader("Model Configuration")
-        st.write(f"**Model:** {config['model']}")
-        
-        # Display model-specific parameters
+        # Model-specific parameters
         if config['model'] == "gpt-5":
-            st.write(f"**Effort:** {config['effort']}")
-            st.write(f"**Verbosity:** {config['verbosity']}")
+            model_params = f"**Effort:** {config['effort']}  \n**Verbosity:** {config['verbosity']}"
         else:
-            st.write(f"**Temperature:** {config['temperature']}")
-            st.write(f"**Top-p:** {config['top_p']}")
-        
-        st.subheader("Response Format")
-        st.write(f"**Type:** {response_format['type']}")
-        st.write(f"**Style:** {response_format['style']}")
-        st.write(f"**Tone:** {response_format['tone']}")
-        st.write(f"**Length:** {response_format['length']}")
-        st.write(f"**Language:** {response_format['language']}")
+            model_params = f"**Temperature:** {config['temperature']}  \n**Top-p:** {config['top_p']}"
         
         # Tool configuration
         if tools:
-            st.subheader("🔧 Tools")
-            st.write(f"**Tools Enabled:** ✅")
-            st.write(f"**Tool Choice:** {tool_choice}")
-            st.write(f"**Number of Tools:** {len(tools)}")
+            tools_info = f"**Tools Enabled:** ✅  \n**Tool Choice:** {tool_choice}  \n**Number of Tools:** {len(tools)}"
         else:
-            st.subheader("🔧 Tools")
-            st.write("**Tools Enabled:** ❌")
+            tools_info = "**Tools Enabled:** ❌"
+        
+        # Render the settings summary as a single element
+        st.markdown(
+            "## ⚙️ Current Settings\n\n"
+            "### Model Configuration\n\n"
+            f"**Model:** {config['model']}  \n{model_params}\n\n"
+            "### Response Format\n\n"
+            f"**Type:** {response_format['type']}  \n"
+            f"**Style:** {response_format['style']}  \n"
+            f"**Tone:** {response_format['tone']}  \n"
+            f"**Length:** {response_format['length']}  \n"
+            f"**Language:** {response_format['language']}\n\n"
+            "### 🔧 Tools\n\n"
+            f"{tools_info}\n\n"
+            "### 🔑 API Status"
+        )
         
         # API status
-        st.subheader("🔑 API Status")
-        if config["api_key"] or os.getenv("OPENAI_API_KEY"):
+        if api_key:
             st.success("API key configured")
         else:
             st.warning("No API key provided")
@@ -5,14 +5,22 @@ OpenAI Responses API Demo
 This script demonstrates the usage of the OpenAI Responses API interface.
 """
 
+import argparse
+import asyncio
+import io
+import importlib.util
+import json
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Use the installed package (pip install -e .); otherwise fall back to the
+# source tree, searched last so other imports don't stat it first
+if importlib.util.find_spec("openai_responses") is None:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-from openai_responses import OpenAIResponsesAPI, ResponseFormat, Tool, ToolFunction
+from openai_responses import AsyncOpenAIResponsesAPI, ResponseFormat, ResponseResponse, ResponseStream, Tool, ToolFunction, run_parallel
+from openai_responses.config import get_api_key
 from openai_responses.exceptions import APIError, AuthenticationError
 
 
@@ -44,74 +52,152 @@ def create_weather_tool() -> Tool:
     )
 
 
-def demo_gpt5_parameters():
+# Tool definitions never change, so build and validate them once
+WEATHER_TOOL = create_weather_tool()
+
+CALCULATOR_TOOL = Tool(
+    type="function",
+    function=ToolFunction(
+        name="calculate",
+        description="Perform basic mathematical operations",
+        parameters={
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["add", "subtract", "multiply", "divide"],
+                    "description": "The mathematical operation to perform"
+                },
+                "a": {"type": "number", "description": "First number"},
+                "b": {"type": "number", "description": "Second number"}
+            },
+            "required": ["operation", "a", "b"]
+        }
+    )
+)
+
+WEB_SEARCH_TOOL = Tool(type="web_search_preview")
+FILE_SEARCH_TOOL = Tool(type="file_search")
+
+# Set by --json: emit one JSON record per response instead of a readable report
+JSON_OUTPUT = False
+
+
+def print_header(title: str, file):
+    """Print a demo section header."""
+    if not JSON_OUTPUT:
+        print("\n" + "=" * 60 + "\n" + title + "\n" + "=" * 60, file=file)
+
+
+def print_note(text: str, file):
+    """Print explanatory text, which JSON output leaves out."""
+    if not JSON_OUTPUT:
+        print(text, file=file)
+
+
+def print_response(title: str, response: ResponseResponse, file):
+    """Print a response: its content, any tool calls and the tokens used."""
+    if JSON_OUTPUT:
+        file.write(json.dumps({
+            "title": title,
+            "content": response.content,
+            "tokens": response.total_tokens,
+            "finish": response.finish_reason,
+            "tool_calls": [tool_call.model_dump(exclude_none=True) for tool_call in response.tool_calls or []],
+        }) + "\n")
+        return
+    
+    lines = [f"\n{title}:\n{response.content}"]
+    if response.tool_calls:
+        lines.append(f"\nTool calls made: {len(response.tool_calls)}")
+        for tool_call in response.tool_calls:
+            lines.append(f"Tool call ID: {tool_call.id}")
+            lines.append(f"Tool call type: {tool_call.type}")
+            if tool_call.hosted_tool:
+                lines.append(f"Hosted tool: {tool_call.hosted_tool}")
+            elif tool_call.function:
+                lines.append(f"Function: {tool_call.function}")
+    lines.append(f"\nTokens used: {response.total_tokens}")
+    print("\n".join(lines), file=file)
+
+
+def print_error(title: str, error: Exception, file):
+    """Print an error raised by a demo request."""
+    if JSON_OUTPUT:
+        file.write(json.dumps({"title": title, "error": str(error)}) + "\n")
+    else:
+        print(f"Error: {error}", file=file)
+
+
+async def demo_gpt5_parameters(api: AsyncOpenAIResponsesAPI) -> str:
     """Demonstrate GPT-5 specific parameters (effort and verbosity)."""
-    print("\n" + "=" * 60)
-    print("GPT-5 Parameters Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    
+    print_header("GPT-5 Parameters Demo", file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
         # Create response format
-        response_format = ResponseFormat(
+        response_format = ResponseFormat.get(
             type="response",
             style="professional",
             tone="neutral",
             length="medium"
         )
         
-        # Test different effort levels
+        # Every effort and verbosity level is an independent request, so
+        # send them all at once
         effort_levels = ["low", "medium", "high"]
-        
-        for effort in effort_levels:
-            print(f"\n--- Testing with effort: {effort} ---")
-            
-            response = api.generate_response(
-                prompt="Explain quantum computing in simple terms",
-                response_format=response_format,
-                model="gpt-5",
-                effort=effort,
-                verbosity="medium"
-            )
-            
-            print(f"Response (effort={effort}):\n{response.content[:200]}...")
-            print(f"Tokens used: {response.total_tokens}")
-        
-        # Test different verbosity levels
         verbosity_levels = ["low", "medium", "high"]
         
-        for verbosity in verbosity_levels:
-            print(f"\n--- Testing with verbosity: {verbosity} ---")
-            
-            response = api.generate_response(
-                prompt="What is machine learning?",
-                response_format=response_format,
-                model="gpt-5",
-                effort="medium",
-                verbosity=verbosity
-            )
-            
-            print(f"Response (verbosity={verbosity}):\n{response.content[:200]}...")
-            print(f"Tokens used: {response.total_tokens}")
+        responses = await run_parallel(
+            api,
+            [
+                {
+                    "prompt": "Explain quantum computing in simple terms",
+                    "response_format": response_format,
+                    "model": "gpt-5",
+                    "effort": effort,
+                    "verbosity": "medium"
+                }
+                for effort in effort_levels
+            ] + [
+                {
+                    "prompt": "What is machine learning?",
+                    "response_format": response_format,
+                    "model": "gpt-5",
+                    "effort": "medium",
+                    "verbosity": verbosity
+                }
+                for verbosity in verbosity_levels
+            ],
+            max_rpm=500,
+            max_tpm=200_000,
+            max_concurrency=20
+        )
+        
+        titles = [f"Response (effort={effort})" for effort in effort_levels]
+        titles += [f"Response (verbosity={verbosity})" for verbosity in verbosity_levels]
+        for title, response in zip(titles, responses):
+            if isinstance(response, Exception):
+                print_error(title, response, file=out)
+            else:
+                print_response(title, response, file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print_error("GPT-5 Parameters", e, file=out)
+    
+    return out.getvalue()
 
 
-def demo_basic_usage():
+async def demo_basic_usage(api: AsyncOpenAIResponsesAPI) -> str:
     """Demonstrate basic API usage."""
-    print("=" * 60)
-    print("Basic Usage Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    
+    print_header("Basic Usage Demo", file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
         # Create response format
-        response_format = ResponseFormat(
+        response_format = ResponseFormat.get(
             type="email",
             style="professional",
             tone="polite",
@@ -119,269 +205,345 @@ def demo_basic_usage():
         )
         
         # Generate response
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="Write a professional email declining a meeting request due to a scheduling conflict",
             response_format=response_format,
             temperature=0.7
         )
         
-        print(f"Generated Email:\n{response.content}")
-        print(f"\nTokens used: {response.total_tokens}")
-        print(f"Model: {response.model}")
+        print_response("Generated Email", response, file=out)
+        print_note(f"Model: {response.model}", file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print_error("Generated Email", e, file=out)
+    
+    return out.getvalue()
+
+
+def print_stream(stream: ResponseStream) -> Optional[ResponseResponse]:
+    """Write a streamed response to stdout as it arrives and return the completed response."""
+    with stream:
+        for delta in stream:
+            sys.stdout.write(delta)
+            sys.stdout.flush()
+    return stream.response
 
 
-def demo_advanced_parameters():
-    """Demonstrate advanced parameter usage."""
-    print("\n" + "=" * 60)
-    print("Advanced Parameters Demo")
-    print("=" * 60)
+async def demo_advanced_parameters(api: AsyncOpenAIResponsesAPI):
+    """Demonstrate advanced parameter usage.
+    
+    The long story is streamed straight to the terminal while the other demos
+    run, so unlike them this demo prints directly instead of returning output.
+    """
+    print_header("Advanced Parameters Demo", file=sys.stdout)
+    
+    # Generate response with custom parameters
+    request = {
+        "prompt": "Write a creative story about a magical forest",
+        "response_format": {
+            "type": "message",
+            "style": "casual",
+            "tone": "enthusiastic",
+            "length": "long"
+        },
+        "model": "gpt-4o",
+        "temperature": 0.9,
+        "top_p": 0.8
+    }
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
+        if JSON_OUTPUT:
+            # A record holds the whole response, so there is nothing to stream
+            print_response("Creative Story", await api.generate_response(**request), file=sys.stdout)
+            return
         
-        # Generate response with custom parameters
-        response = api.generate_response(
-            prompt="Write a creative story about a magical forest",
-            response_format={
-                "type": "message",
-                "style": "casual",
-                "tone": "enthusiastic",
-                "length": "long"
-            },
-            model="gpt-4o",
-            temperature=0.9,
-            top_p=0.8
-        )
+        stream = await api.generate_response_stream(**request)
         
-        print(f"Creative Story:\n{response.content}")
-        print(f"\nTokens used: {response.total_tokens}")
+        print("Creative Story:")
+        # Reading the stream blocks, so consume it in a worker thread
+        response = await asyncio.to_thread(print_stream, stream)
+        if response:
+            print(f"\n\nTokens used: {response.total_tokens}")
         
     except Exception as e:
-        print(f"Error: {e}")
+        print_error("Creative Story", e, file=sys.stdout)
 
 
-def demo_tool_calling():
-    """Demonstrate tool calling functionality."""
-    print("\n" + "=" * 60)
-    print("Tool Calling Demo")
-    print("=" * 60)
+async def demo_batch(api: AsyncOpenAIResponsesAPI) -> str:
+    """Demonstrate the Batch API with the long, non-interactive requests.
+    
+    Batched requests cost less but can take up to 24 hours to complete.
+    """
+    out = io.StringIO()
+    
+    print_header("Batch API Demo", file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
+        batch = await api.create_batch([
+            {
+                "prompt": "Write a creative story about a magical forest",
+                "response_format": {
+                    "type": "message",
+                    "style": "casual",
+                    "tone": "enthusiastic",
+                    "length": "long"
+                },
+                "temperature": 0.9,
+                "top_p": 0.8
+            },
+            {
+                "prompt": "Write a formal letter to a client explaining a project delay",
+                "response_format": {
+                    "type": "letter",
+                    "style": "formal",
+                    "tone": "professional",
+                    "length": "long"
+                }
+            }
+        ])
+        print_note(f"Submitted batch {batch['id']}, waiting for it to complete...", file=out)
         
-        # Create a weather tool
-        weather_tool = create_weather_tool()
+        batch = await api.wait_for_batch(batch["id"], poll_interval=30)
+        results = await api.get_batch_results(batch)
         
+        for title, result in zip(["Creative Story", "Formal Letter"], results):
+            if isinstance(result, Exception):
+                print_error(title, result, file=out)
+            else:
+                print_response(title, result, file=out)
+        
+    except Exception as e:
+        print_error("Batch API", e, file=out)
+    
+    return out.getvalue()
+
+
+async def demo_tool_calling(api: AsyncOpenAIResponsesAPI) -> str:
+    """Demonstrate tool calling functionality."""
+    out = io.StringIO()
+    
+    print_header("Tool Calling Demo", file=out)
+    
+    try:
         # Generate response with tool
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="What's the weather like in New York City? Please provide a detailed response.",
             response_format={
                 "type": "message",
                 "style": "casual",
                 "tone": "friendly"
             },
-            tools=[weather_tool],
+            tools=[WEATHER_TOOL],
             tool_choice="auto"
         )
         
-        print(f"Response with Tool:\n{response.content}")
-        
-        # Check for tool calls
-        if response.tool_calls:
-            print(f"\nTool calls made: {len(response.tool_calls)}")
-            for tool_call in response.tool_calls:
-                print(f"Tool call ID: {tool_call.id}")
-                print(f"Tool call type: {tool_call.type}")
-                if tool_call.hosted_tool:
-                    print(f"Hosted tool: {tool_call.hosted_tool}")
-                elif tool_call.function:
-                    print(f"Function: {tool_call.function}")
-        
-        print(f"\nTokens used: {response.total_tokens}")
+        print_response("Response with Tool", response, file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print_error("Response with Tool", e, file=out)
+    
+    return out.getvalue()
 
 
-def demo_response_methods():
+async def demo_response_methods(api: AsyncOpenAIResponsesAPI) -> str:
     """Demonstrate response-specific methods."""
-    print("\n" + "=" * 60)
-    print("Response Methods Demo")
-    print("=" * 60)
+    out = io.StringIO()
     
-    try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
-        # Create a calculator tool
-        calculator_tool = Tool(
-            type="function",
-            function=ToolFunction(
-                name="calculate",
-                description="Perform basic mathematical operations",
-                parameters={
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["add", "subtract", "multiply", "divide"],
-                            "description": "The mathematical operation to perform"
-                        },
-                        "a": {"type": "number", "description": "First number"},
-                        "b": {"type": "number", "description": "Second number"}
-                    },
-                    "required": ["operation", "a", "b"]
-                }
-            )
-        )
-        
-        # Email with tool
-        print("\n1. Email Response with Tool")
-        email_response = api.create_email_response(
+    print_header("Response Methods Demo", file=out)
+    
+    # The three requests are independent, so send them at once
+    responses = await asyncio.gather(
+        api.create_email_response(
             prompt="Calculate the total cost for 5 items at $12.50 each and include it in a professional email to the client.",
             style="professional",
             tone="polite",
-            tools=[calculator_tool],
+            tools=[CALCULATOR_TOOL],
             tool_choice="auto"
-        )
-        print(f"Email: {email_response.content}")
-        
-        # Letter with tool
-        print("\n2. Letter Response with Tool")
-        letter_response = api.create_letter_response(
+        ),
+        api.create_letter_response(
             prompt="Write a formal letter explaining the weather calculation for our outdoor event planning.",
             style="formal",
             tone="professional",
-            tools=[create_weather_tool()],
+            tools=[WEATHER_TOOL],
             tool_choice="auto"
-        )
-        print(f"Letter: {letter_response.content}")
-        
-        # Message with tool
-        print("\n3. Message Response with Tool")
-        message_response = api.create_message_response(
+        ),
+        api.create_message_response(
             prompt="Send a friendly message to a friend with a quick calculation.",
             style="casual",
             tone="friendly",
-            tools=[calculator_tool],
+            tools=[CALCULATOR_TOOL],
             tool_choice="auto"
-        )
-        print(f"Message: {message_response.content}")
-        
-    except Exception as e:
-        print(f"Error: {e}")
+        ),
+        return_exceptions=True
+    )
+    
+    titles = [
+        "1. Email Response with Tool",
+        "2. Letter Response with Tool",
+        "3. Message Response with Tool",
+    ]
+    for title, response in zip(titles, responses):
+        if isinstance(response, Exception):
+            print_error(title, response, file=out)
+        else:
+            print_response(title, response, file=out)
+    
+    return out.getvalue()
 
 
-def demo_hosted_tools():
+async def demo_hosted_tools(api: AsyncOpenAIResponsesAPI) -> str:
     """Demonstrate hosted tools usage."""
-    print("\n" + "=" * 60)
-    print("Hosted Tools Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    
+    print_header("Hosted Tools Demo", file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
-        # Create hosted tool references (OpenAI's pre-built tools)
-        web_search_tool = Tool(
-            type="web_search_preview"
-        )
-        
-        file_search_tool = Tool(
-            type="file_search"
+        print_note(
+            "Using OpenAI's pre-built hosted tools:\n"
+            "- web_search_preview: Search the web for current information\n"
+            "- file_search: Search through files in your workspace",
+            file=out
         )
         
-        print("Using OpenAI's pre-built hosted tools:")
-        print("- web_search_preview: Search the web for current information")
-        print("- file_search: Search through files in your workspace")
-        
         # Generate response with web search tool
-        print("\n1. Web Search Tool Example")
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="Search for the latest news about AI developments and summarize them.",
             response_format={
                 "type": "message",
                 "style": "professional",
                 "tone": "informative"
             },
-            tools=[web_search_tool],
+            tools=[WEB_SEARCH_TOOL],
             tool_choice="auto"
         )
         
-        print(f"Response: {response.content}")
-        
-        if response.tool_calls:
-            print(f"\nWeb search tool calls made: {len(response.tool_calls)}")
-            for tool_call in response.tool_calls:
-                print(f"Tool call ID: {tool_call.id}")
-                print(f"Tool call type: {tool_call.type}")
-                if tool_call.hosted_tool:
-                    print(f"Hosted tool: {tool_call.hosted_tool}")
+        print_response("1. Web Search Tool Example", response, file=out)
         
         # Generate response with file search tool
-        print("\n2. File Search Tool Example")
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="Search through available files to find information about the project structure.",
             response_format={
                 "type": "message",
                 "style": "casual",
                 "tone": "helpful"
             },
-            tools=[file_search_tool],
+            tools=[FILE_SEARCH_TOOL],
             tool_choice="auto"
         )
         
-        print(f"Response: {response.content}")
-        
-        if response.tool_calls:
-            print(f"\nFile search tool calls made: {len(response.tool_calls)}")
-            for tool_call in response.tool_calls:
-                print(f"Tool call ID: {tool_call.id}")
-                print(f"Tool call type: {tool_call.type}")
-                if tool_call.hosted_tool:
-                    print(f"Hosted tool: {tool_call.hosted_tool}")
+        print_response("2. File Search Tool Example", response, file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print_error("Hosted Tools", e, file=out)
+    
+    return out.getvalue()
+
+
+async def demo_error_handling() -> str:
+    """Demonstrate error handling."""
+    out = io.StringIO()
+    
+    print_header("Error Handling Demo", file=out)
+    
+    # A malformed key is rejected locally, without a request to the API
+    async with AsyncOpenAIResponsesAPI(api_key="invalid-key") as api:
+        try:
+            await api.create_email_response(prompt="Test prompt")
+        except AuthenticationError as e:
+            print_error("Authentication error", e, file=out)
+        except APIError as e:
+            print_error("API error", e, file=out)
+    
+    return out.getvalue()
+
+
+async def run_demos(batch: bool = False) -> List[str]:
+    """Run the independent demos concurrently and return their buffered output.
+    
+    With ``batch`` the long-form requests go through the Batch API instead of
+    being streamed.
+    """
+    # One client for every demo, so they share its pooled connections
+    try:
+        api = AsyncOpenAIResponsesAPI()
+    except Exception as e:
+        out = io.StringIO()
+        print_error("Client setup", e, file=out)
+        return [out.getvalue()]
+    
+    async with api:
+        demos = [
+            demo_basic_usage(api),
+            demo_tool_calling(api),
+            demo_response_methods(api),
+            demo_hosted_tools(api),
+            demo_gpt5_parameters(api),
+            demo_error_handling(),
+        ]
+        if batch:
+            return await asyncio.gather(*demos, demo_batch(api))
+        
+        others = asyncio.gather(*demos)
+        # Stream the long story while the others run in the background
+        await demo_advanced_parameters(api)
+        return await others
 
 
 def main():
     """Run all demos."""
-    print("🚀 OpenAI Responses API Demo")
-    print("This demo showcases the Python interface for OpenAI's Responses API")
+    parser = argparse.ArgumentParser(description="OpenAI Responses API demo")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="send the long-form requests through the Batch API (cheaper, completes within 24h)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print one JSON record per response instead of a readable report",
+    )
+    args = parser.parse_args()
+    
+    global JSON_OUTPUT
+    JSON_OUTPUT = args.json
+    if JSON_OUTPUT:
+        sys.stdout.write("".join(asyncio.run(run_demos(batch=args.batch))))
+        return
+    
+    header = (
+        "🚀 OpenAI Responses API Demo\n"
+        "This demo showcases the Python interface for OpenAI's Responses API"
+    )
     
     # Check if API key is set
-    if not os.getenv("OPENAI_API_KEY"):
-        print("\n⚠️  Warning: OPENAI_API_KEY environment variable is not set.")
-        print("   Set it with: export OPENAI_API_KEY='your-api-key-here'")
-        print("   Some examples may fail without a valid API key.")
-    
-    # Run demos
-    demo_basic_usage()
-    demo_advanced_parameters()
-    demo_tool_calling()
-    demo_response_methods()
-    demo_hosted_tools()
-    demo_gpt5_parameters() # Added this line to call the new demo function
-    
-    print("\n" + "=" * 60)
-    print("Demo Complete!")
-    print("=" * 60)
-    print("\nKey Features Demonstrated:")
-    print("✅ Basic response generation")
-    print("✅ Advanced parameter configuration")
-    print("✅ Function tools with JSON schema")
-    print("✅ Hosted tools with tool IDs")
-    print("✅ Response-specific methods (email, letter, message)")
-    print("✅ Tool call detection and handling")
-    print("\nFor more examples, see:")
-    print("- tool_calling_example.py (comprehensive tool examples)")
-    print("- python run_app.py (web interface)")
+    if not get_api_key():
+        header += (
+            "\n\n⚠️  Warning: OPENAI_API_KEY environment variable is not set.\n"
+            "   Set it with: export OPENAI_API_KEY='your-api-key-here'\n"
+            "   Some examples may fail without a valid API key."
+        )
+    print(header, flush=True)
+    
+    # Run demos concurrently; the streaming demo prints first, then the
+    # buffered output of the rest in one write
+    sys.stdout.write("".join(asyncio.run(run_demos(batch=args.batch))))
+    
+    print(
+        "\n" + "=" * 60 + "\n"
+        "Demo Complete!\n"
+        + "=" * 60 + "\n"
+        "\nKey Features Demonstrated:\n"
+        "✅ Basic response generation\n"
+        "✅ Advanced parameter configuration\n"
+        "✅ Function tools with JSON schema\n"
+        "✅ Hosted tools with tool IDs\n"
+        "✅ Response-specific methods (email, letter, message)\n"
+        "✅ Tool call detection and handling\n"
+        "✅ Error handling\n"
+        "\nFor more examples, see:\n"
+        "- tool_calling_example.py (comprehensive tool examples)\n"
+        "- python run_app.py (web interface)"
+    )
 
 
 if __name__ == "__main__":
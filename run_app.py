@@ -6,19 +6,33 @@ Launcher script for the Streamlit web interface.
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent
+REQUIREMENTS = ROOT / "requirements.txt"
+# Written after requirements.txt was installed successfully
+DEPS_STAMP = Path.home() / ".cache" / "openai-responses-demo" / "deps.ok"
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import streamlit
+    # find_spec locates the package without importing it
+    if importlib.util.find_spec("streamlit"):
         print("✅ Streamlit is installed")
         return True
-    except ImportError:
-        print("❌ Streamlit is not installed")
-        print("Installing dependencies...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        return True
+    
+    print("❌ Streamlit is not installed")
+    if DEPS_STAMP.exists() and DEPS_STAMP.stat().st_mtime >= REQUIREMENTS.stat().st_mtime:
+        # These requirements were already installed; running pip again won't help
+        print(f"   Dependencies were already installed; check that {sys.executable} is the right interpreter")
+        return False
+    
+    print("Installing dependencies...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(REQUIREMENTS)])
+    DEPS_STAMP.parent.mkdir(parents=True, exist_ok=True)
+    DEPS_STAMP.touch()
+    importlib.invalidate_caches()
+    return True
 
 def check_api_key():
     """Check if API key is configured."""
@@ -48,13 +62,21 @@ def main():
     print("   Press Ctrl+C to stop the server")
     print("=" * 50)
     
+    command = [
+        sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"),
+        "--server.port", "8501",
+        "--server.address", "localhost"
+    ]
+    
     # Launch Streamlit
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "app.py",
-            "--server.port", "8501",
-            "--server.address", "localhost"
-        ])
+        if os.name == "posix":
+            # Replace this process instead of forking a child and waiting on it;
+            # exec discards anything still buffered, so flush the banner first
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, command)
+        subprocess.run(command)
     except KeyboardInterrupt:
         print("\n👋 App stopped by user")
     except Exception as e:
@@ -40,6 +40,9 @@ setup(
     python_requires=">=3.13",
     install_requires=read_requirements(),
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
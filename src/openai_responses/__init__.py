@@ -4,19 +4,56 @@ OpenAI Responses API Python Interface
 A clean, type-safe interface for OpenAI's Responses API.
 """
 
-from .client import OpenAIResponsesAPI
-from .models import ResponseFormat, ResponseResponse, Tool, ToolFunction, ToolCall
+import importlib
+from typing import TYPE_CHECKING
+
 from .exceptions import OpenAIResponsesError, APIError, ValidationError
 
+if TYPE_CHECKING:
+    from .client import OpenAIResponsesAPI
+    from .async_client import AsyncOpenAIResponsesAPI
+    from .parallel import run_parallel
+    from .models import ResponseFormat, ResponseResponse, Tool, ToolFunction, ToolCall
+    from .streaming import ResponseStream
+
 __version__ = "0.1.0"
 __all__ = [
     "OpenAIResponsesAPI",
+    "AsyncOpenAIResponsesAPI",
     "ResponseFormat",
     "ResponseResponse",
+    "ResponseStream",
+    "run_parallel",
     "Tool",
-    "ToolFunction", 
+    "ToolFunction",
     "ToolCall",
     "OpenAIResponsesError",
     "APIError",
     "ValidationError",
-] 
\ No newline at end of file
+]
+
+# Submodules that pull in requests, dotenv and pydantic are imported on first
+# attribute access, so importing only the exceptions stays cheap
+_LAZY = {
+    "OpenAIResponsesAPI": ".client",
+    "AsyncOpenAIResponsesAPI": ".async_client",
+    "run_parallel": ".parallel",
+    "ResponseFormat": ".models",
+    "ResponseResponse": ".models",
+    "Tool": ".models",
+    "ToolFunction": ".models",
+    "ToolCall": ".models",
+    "ResponseStream": ".streaming",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,25 @@
+"""
+JSON encoding for API payloads, using orjson when it is installed.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or a string."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
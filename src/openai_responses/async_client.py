@@ -0,0 +1,155 @@
+"""
+Asyncio client for OpenAI Responses API.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from .client import OpenAIResponsesAPI
+from .exceptions import APIError
+from .models import ResponseResponse
+from .streaming import ResponseStream
+
+
+class AsyncOpenAIResponsesAPI:
+    """
+    Asyncio interface to the OpenAI Responses API.
+
+    Wraps OpenAIResponsesAPI and runs each blocking request in a worker thread,
+    so independent requests can be awaited concurrently while sharing a single
+    HTTP session and its connection pool. The client has its own thread pool,
+    one worker per pooled connection, so concurrency isn't capped by the size
+    of the event loop's default executor.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_connections: int = 20,
+        cache_size: int = 256,
+        cache_ttl: float = 3600,
+    ):
+        """
+        Initialize the async OpenAI Responses API client.
+
+        Args:
+            api_key: OpenAI API key. If not provided, will try to load from environment.
+            base_url: Base URL for the API. Defaults to OpenAI's production URL.
+            timeout: Request timeout in seconds.
+            max_retries: Maximum number of retries for failed requests.
+            max_connections: Keep-alive connections kept open per host. Size it
+                to the number of requests you run concurrently.
+            cache_size: Maximum responses kept by the ``generate_response`` cache;
+                0 disables caching.
+            cache_ttl: Seconds a cached response stays valid.
+        """
+        self.client = OpenAIResponsesAPI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_connections=max_connections,
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="openai-responses")
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking client call on the client's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def generate_response(self, *args, **kwargs) -> ResponseResponse:
+        """Generate a response. Takes the same arguments as ``OpenAIResponsesAPI.generate_response``."""
+        return await self._run(self.client.generate_response, *args, **kwargs)
+
+    async def generate_response_stream(self, *args, **kwargs) -> ResponseStream:
+        """
+        Open a streamed response. Takes the same arguments as ``OpenAIResponsesAPI.generate_response_stream``.
+
+        Iterating the returned stream blocks on the network, so consume it in a
+        worker thread (e.g. ``asyncio.to_thread``) to keep the event loop free.
+        """
+        return await self._run(self.client.generate_response_stream, *args, **kwargs)
+
+    def specialize(self, *args, **kwargs) -> Callable[[str], Awaitable[ResponseResponse]]:
+        """
+        Create an async generator function for a fixed response format and model.
+
+        Takes the same arguments as ``OpenAIResponsesAPI.specialize``; the request
+        body is validated and built once, up front.
+
+        Returns:
+            Coroutine function taking a prompt and returning a ResponseResponse.
+        """
+        generate = self.client.specialize(*args, **kwargs)
+
+        async def generate_async(prompt: str) -> ResponseResponse:
+            return await self._run(generate, prompt)
+
+        return generate_async
+
+    async def generate_responses(self, requests: List[Dict[str, Any]]) -> List[ResponseResponse]:
+        """
+        Generate several independent responses concurrently.
+
+        The Responses API takes a single input per request, so this is the
+        batching primitive: the requests share the client's pooled connections
+        and complete in roughly the time of the slowest one.
+
+        Args:
+            requests: Keyword arguments for ``generate_response``, one dict per request.
+
+        Returns:
+            The responses, in the same order as ``requests``.
+        """
+        return await asyncio.gather(*(self.generate_response(**request) for request in requests))
+
+    async def create_email_response(self, *args, **kwargs) -> ResponseResponse:
+        """Create an email response. Takes the same arguments as ``OpenAIResponsesAPI.create_email_response``."""
+        return await self._run(self.client.create_email_response, *args, **kwargs)
+
+    async def create_letter_response(self, *args, **kwargs) -> ResponseResponse:
+        """Create a letter response. Takes the same arguments as ``OpenAIResponsesAPI.create_letter_response``."""
+        return await self._run(self.client.create_letter_response, *args, **kwargs)
+
+    async def create_message_response(self, *args, **kwargs) -> ResponseResponse:
+        """Create a message response. Takes the same arguments as ``OpenAIResponsesAPI.create_message_response``."""
+        return await self._run(self.client.create_message_response, *args, **kwargs)
+
+    async def create_batch(self, *args, **kwargs) -> Dict[str, Any]:
+        """Submit requests to the Batch API. Takes the same arguments as ``OpenAIResponsesAPI.create_batch``."""
+        return await self._run(self.client.create_batch, *args, **kwargs)
+
+    async def wait_for_batch(self, batch_id: str, poll_interval: float = 10.0, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Poll a batch until it reaches a terminal state, without blocking the event loop."""
+        deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+        while True:
+            batch = await self._run(self.client.retrieve_batch, batch_id)
+            if batch["status"] in ("completed", "failed", "expired", "cancelled"):
+                return batch
+            if deadline is not None and asyncio.get_running_loop().time() >= deadline:
+                raise APIError(f"Batch {batch_id} still {batch['status']} after {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+    async def get_batch_results(self, batch: Dict[str, Any]) -> List[Union[ResponseResponse, APIError]]:
+        """Download the results of a finished batch. See ``OpenAIResponsesAPI.get_batch_results``."""
+        return await self._run(self.client.get_batch_results, batch)
+
+    def close(self):
+        """Close the underlying client, its session and the thread pool."""
+        self._executor.shutdown(wait=False)
+        self.client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.close()
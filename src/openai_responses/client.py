@@ -2,14 +2,26 @@
 Main client for OpenAI Responses API.
 """
 
-import os
+import email.utils
+import functools
+import hashlib
+import logging
+import random
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, Union, List
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Union, List, Callable
+import pydantic
 import requests
-from dotenv import load_dotenv
-import json
+from requests.adapters import HTTPAdapter
 
+from . import _json
+from .config import get_api_key
 from .models import ResponseFormat, ResponseResponse, Tool, ToolCall
+from .streaming import ResponseStream
 from .exceptions import (
     OpenAIResponsesError,
     APIError,
@@ -20,6 +32,188 @@ from .exceptions import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Plain-text output format shared by every request body; never mutated
+_TEXT_FORMAT = {"format": {"type": "text"}}
+
+# Shape of an OpenAI secret key; anything else is rejected before it is sent
+_API_KEY_PATTERN = re.compile(r"sk-[A-Za-z0-9_-]{20,}")
+
+
+@functools.lru_cache(maxsize=256)
+def _tool_from_json(tool_json: bytes) -> Dict[str, Any]:
+    """Validate a tool given as a dict (serialized as the cache key) and return its API form."""
+    return Tool(**_json.loads(tool_json)).api_dict
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Parse a Retry-After header, in seconds or as an HTTP date, into seconds to wait."""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# Error bodies are read up to this many bytes; some echo the whole request
+MAX_ERROR_BODY = 64 * 1024
+
+# generate_response options the create_*_response helpers pass through
+_TYPED_RESPONSE_OPTIONS = ("model", "temperature", "top_p", "effort", "verbosity", "cache")
+
+# Server errors that are usually transient, so worth retrying
+_RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+
+def _error_data(response: requests.Response) -> Dict[str, Any]:
+    """Parse the JSON body of a streamed error response, reading at most MAX_ERROR_BODY bytes."""
+    try:
+        # A chunk can be a single transfer chunk, so read until the cap or EOF
+        body = bytearray()
+        for chunk in response.iter_content(MAX_ERROR_BODY):
+            body += chunk
+            if len(body) >= MAX_ERROR_BODY:
+                break
+        data = _json.loads(body) if body else {}
+        return data if isinstance(data, dict) else {}
+    except (ValueError, requests.exceptions.RequestException):
+        # Truncated, not JSON, or the connection dropped mid-body
+        return {}
+    finally:
+        response.close()
+
+
+@functools.cache
+def _shared_adapter(max_connections: int) -> HTTPAdapter:
+    """
+    Return the process-wide connection pool for clients of this size.
+    
+    Clients share it, so a new client reuses connections (and their TLS
+    sessions) opened by earlier ones. The API key is sent per request, so
+    clients with different keys can share it too.
+    """
+    # Keep enough pooled keep-alive connections for concurrent callers.
+    # When the pool is exhausted extra connections are opened rather than
+    # waited for, and urllib3 never retries: _request owns the retry policy.
+    return HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max_connections,
+        pool_block=False,
+        max_retries=0,
+    )
+
+
+def _check_prompt(prompt: str):
+    """Reject an empty prompt, which the API would only refuse after a round trip."""
+    if not prompt or not prompt.strip():
+        raise ValidationError("Prompt must not be empty.", "prompt")
+
+
+class _RetryGuard:
+    """
+    Retry budget and circuit breaker shared by all requests of one client.
+    
+    Every failed attempt spends a token and every success earns back a tenth
+    of one; retries are only allowed while more than half the budget is left,
+    so a degraded API sees roughly one retry per ten successes instead of a
+    retry storm. After ``threshold`` consecutive failures the breaker opens
+    and requests fail fast for ``cooldown`` seconds; afterwards it takes
+    another ``threshold`` failures to open it again.
+    
+    Rate limits (429) spend budget but don't count towards opening the
+    breaker: the API is up, and callers such as ``run_parallel`` back off
+    on the RateLimitError instead.
+    """
+    
+    __slots__ = ("budget", "threshold", "cooldown", "_tokens", "_failures", "_open_until", "_lock")
+    
+    def __init__(self, budget: float = 10, threshold: int = 5, cooldown: float = 30):
+        self.budget = budget
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._tokens = budget
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        return time.monotonic() >= self._open_until
+    
+    def allow_retry(self) -> bool:
+        return self._tokens > self.budget / 2 and self.allow_request()
+    
+    def success(self):
+        with self._lock:
+            self._failures = 0
+            self._tokens = min(self.budget, self._tokens + 0.1)
+    
+    def throttled(self):
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+    
+    def failure(self):
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open_until = time.monotonic() + self.cooldown
+                # Count afresh once the cooldown is over
+                self._failures = 0
+
+
+class _ResponseCache:
+    """
+    Thread-safe LRU cache of responses keyed by request body, with a TTL.
+    
+    Entries are stored and returned as deep copies, so a caller modifying its
+    response can't change what later callers get.
+    """
+    
+    __slots__ = ("max_entries", "ttl", "_entries", "_lock")
+    
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(request_data: Dict[str, Any]) -> bytes:
+        # The body is built in a fixed key order, so equal requests serialize equally
+        return hashlib.blake2b(_json.dumps(request_data), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[ResponseResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return response.model_copy(deep=True)
+    
+    def put(self, key: bytes, response: ResponseResponse):
+        response = response.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class OpenAIResponsesAPI:
     """
     Client for OpenAI Responses API.
@@ -27,15 +221,37 @@ class OpenAIResponsesAPI:
     Provides a clean interface for generating structured responses using OpenAI's Responses API.
     """
     
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "responses_endpoint",
+        "timeout",
+        "max_retries",
+        "max_connections",
+        "session",
+        "_key_malformed",
+        "_cache",
+        "_retry_guard",
+    )
+    
     BASE_URL = "https://api.openai.com/v1"
     RESPONSES_ENDPOINT = f"{BASE_URL}/responses"
     
+    # Retry backoff in seconds: full jitter over BASE_BACKOFF * 2**attempt, capped
+    BASE_BACKOFF = 0.5
+    MAX_BACKOFF = 30
+    # Longest Retry-After honoured before retrying anyway
+    MAX_RETRY_AFTER = 30
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
+        max_connections: int = 20,
+        cache_size: int = 256,
+        cache_ttl: float = 3600,
     ):
         """
         Initialize the OpenAI Responses API client.
@@ -45,22 +261,32 @@ class OpenAIResponsesAPI:
             base_url: Base URL for the API. Defaults to OpenAI's production URL.
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
+            max_connections: Keep-alive connections kept open per host, i.e. how
+                many concurrent requests can reuse a connection.
+            cache_size: Maximum responses kept by the ``generate_response`` cache;
+                0 disables caching, including for ``temperature=0`` requests.
+            cache_ttl: Seconds a cached response stays valid.
         """
-        # Load environment variables
-        load_dotenv()
-        
-        # Set API key
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        # Set API key, falling back to the environment (and .env)
+        self.api_key = api_key or get_api_key()
         if not self.api_key:
             raise AuthenticationError("OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
         
         # Set base URL
         self.base_url = base_url or self.BASE_URL
+        
+        # Keys for OpenAI itself have a known shape; proxies and other hosts may not
+        self._key_malformed = (
+            self.base_url == self.BASE_URL and not _API_KEY_PATTERN.fullmatch(self.api_key)
+        )
         self.responses_endpoint = f"{self.base_url}/responses"
         
         # Set request parameters
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_connections = max_connections
+        self._cache = _ResponseCache(cache_size, cache_ttl)
+        self._retry_guard = _RetryGuard()
         
         # Set up session
         self.session = requests.Session()
@@ -69,6 +295,9 @@ class OpenAIResponsesAPI:
             "Content-Type": "application/json",
             "User-Agent": "openai-responses-api/0.1.0",
         })
+        adapter = _shared_adapter(max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def generate_response(
         self,
@@ -82,6 +311,7 @@ class OpenAIResponsesAPI:
         tools: Optional[List[Union[Tool, Dict[str, Any]]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         previous_response_id: Optional[str] = None,
+        cache: Optional[bool] = None,
     ) -> ResponseResponse:
         """
         Generate a response using the OpenAI Responses API.
@@ -97,6 +327,11 @@ class OpenAIResponsesAPI:
             tools: List of tools available to the model (function tools or hosted tools).
             tool_choice: Tool choice configuration ('auto', 'none', or specific tool).
             previous_response_id: ID of the previous response for conversation continuity.
+            cache: Return a previous response to an identical request if there is
+                one. Defaults to caching only greedy requests (``temperature=0``
+                on a non-GPT-5 model); pass True to cache sampled requests too,
+                or False to always call the API. Ignored when the client was
+                created with ``cache_size=0``.
             
         Returns:
             ResponseResponse object containing the generated response.
@@ -108,65 +343,116 @@ class OpenAIResponsesAPI:
             QuotaExceededError: If quota is exceeded.
         """
         try:
-            # Convert dict to ResponseFormat if needed
-            if isinstance(response_format, dict):
-                response_format = ResponseFormat(**response_format)
-            
-            # Convert dict tools to Tool objects if needed
-            if tools:
-                tools = [
-                    Tool(**tool) if isinstance(tool, dict) else tool
-                    for tool in tools
-                ]
-            
-            # Create request data with correct API structure
-            request_data = {
-                "model": model,
-                "input": prompt,
-                "text": {
-                    "format": {
-                        "type": "text"
-                    }
-                },
-            }
-            
-            # Add model-specific parameters
-            if model == "gpt-5":
-                # GPT-5 uses effort and verbosity instead of temperature/top_p
-                if effort:
-                    request_data["reasoning"] = {
-                        "effort": effort
-                    }
-                if verbosity:
-                    request_data["text"]["verbosity"] = verbosity
-            else:
-                # Traditional models use temperature and top_p
-                if temperature is not None:
-                    request_data["temperature"] = temperature
-                if top_p is not None:
-                    request_data["top_p"] = top_p
+            _check_prompt(prompt)
+            request_data = self._build_request_data(
+                prompt=prompt,
+                response_format=response_format,
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                effort=effort,
+                verbosity=verbosity,
+                tools=tools,
+                tool_choice=tool_choice,
+                previous_response_id=previous_response_id,
+            )
+            logger.debug("Request body: %s", request_data)
+
+            if cache is None:
+                # Greedy decoding asks for the same answer every time
+                cache = request_data.get("temperature") == 0
+            cache = cache and self._cache.max_entries > 0
+            if cache:
+                key = self._cache.key(request_data)
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+
+            # Make API request
+            response = ResponseResponse.model_validate(self._make_request(request_data))
+            if cache:
+                self._cache.put(key, response)
+            return response
             
-            # Add previous_response_id for conversation continuity
-            if previous_response_id:
-                request_data["previous_response_id"] = previous_response_id
+        except ValidationError:
+            raise
+        except Exception as e:
+            if isinstance(e, OpenAIResponsesError):
+                raise
+            raise APIError(f"Unexpected error: {str(e)}")
+    
+    def generate_responses(
+        self,
+        items: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[ResponseResponse]:
+        """
+        Generate several independent responses concurrently.
+        
+        The requests run on a thread pool and share the session's pooled
+        keep-alive connections, so they complete in roughly the time of the
+        slowest one.
+        
+        Args:
+            items: Keyword arguments for ``generate_response``, one dict per request.
+            max_workers: Requests in flight at once. Defaults to ``max_connections``;
+                more than that would open connections outside the pool.
             
-            # Add tools if provided
-            if tools:
-                request_data["tools"] = [tool.model_dump(exclude_none=True) for tool in tools]
+        Returns:
+            The responses, in the same order as ``items``.
             
-            # Add tool_choice if provided
-            if tool_choice:
-                request_data["tool_choice"] = tool_choice
+        Raises:
+            OpenAIResponsesError: The first error raised by any of the requests.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_connections) as executor:
+            return list(executor.map(lambda request: self.generate_response(**request), items))
+    
+    def generate_response_stream(
+        self,
+        prompt: str,
+        response_format: Union[ResponseFormat, Dict[str, Any]],
+        model: str = "gpt-4o",
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        effort: Optional[str] = None,
+        verbosity: Optional[str] = None,
+        tools: Optional[List[Union[Tool, Dict[str, Any]]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        previous_response_id: Optional[str] = None,
+    ) -> ResponseStream:
+        """
+        Generate a response using the OpenAI Responses API, streaming the output.
+        
+        Takes the same arguments as ``generate_response``. Iterating the returned
+        stream yields text deltas as they arrive; once it is exhausted the
+        complete response is available as ``stream.response``.
+        
+        Returns:
+            ResponseStream over the generated text.
             
-            # Remove None values
-            request_data = {k: v for k, v in request_data.items() if v is not None}
-            print(request_data)
-
-            # Make API request
-            response = self._make_request(request_data)
+        Raises:
+            ValidationError: If request parameters are invalid.
+            APIError: If the API request fails.
+            RateLimitError: If rate limit is exceeded.
+            QuotaExceededError: If quota is exceeded.
+        """
+        try:
+            _check_prompt(prompt)
+            request_data = self._build_request_data(
+                prompt=prompt,
+                response_format=response_format,
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                effort=effort,
+                verbosity=verbosity,
+                tools=tools,
+                tool_choice=tool_choice,
+                previous_response_id=previous_response_id,
+            )
+            request_data["stream"] = True
             
-            # Parse and return response
-            return ResponseResponse(**response)
+            return ResponseStream(self._send_request(request_data, stream=True))
             
         except ValidationError:
             raise
@@ -175,6 +461,138 @@ class OpenAIResponsesAPI:
                 raise
             raise APIError(f"Unexpected error: {str(e)}")
     
+    def specialize(
+        self,
+        type: str,
+        style: Optional[str] = None,
+        tone: Optional[str] = None,
+        length: Optional[str] = None,
+        model: str = "gpt-4o",
+        **kwargs
+    ) -> Callable[[str], ResponseResponse]:
+        """
+        Create a generator function for a fixed response format and model.
+        
+        The request body is validated and built once; each call of the returned
+        function only substitutes the prompt before sending it.
+        
+        Args:
+            type: Response type ('email', 'letter', 'message', etc.).
+            style: Response style.
+            tone: Response tone.
+            length: Response length ('short', 'medium', 'long').
+            model: OpenAI model to use.
+            **kwargs: Other ``generate_response`` parameters (temperature, top_p,
+                effort, verbosity, tools, tool_choice).
+            
+        Returns:
+            Function taking a prompt and returning a ResponseResponse.
+            
+        Raises:
+            ValidationError: If the parameters are invalid.
+        """
+        try:
+            response_format = ResponseFormat.get(type=type, style=style, tone=tone, length=length)
+        except pydantic.ValidationError as e:
+            raise ValidationError(f"Invalid response format: {e}", "response_format")
+        template = self._build_request_data(
+            prompt="",
+            response_format=response_format,
+            model=model,
+            temperature=kwargs.get("temperature"),
+            top_p=kwargs.get("top_p"),
+            effort=kwargs.get("effort"),
+            verbosity=kwargs.get("verbosity"),
+            tools=kwargs.get("tools"),
+            tool_choice=kwargs.get("tool_choice"),
+            previous_response_id=None,
+        )
+        
+        def generate(prompt: str) -> ResponseResponse:
+            try:
+                _check_prompt(prompt)
+                return ResponseResponse.model_validate(self._make_request({**template, "input": prompt}))
+            except OpenAIResponsesError:
+                raise
+            except Exception as e:
+                raise APIError(f"Unexpected error: {str(e)}")
+        
+        return generate
+    
+    def _build_request_data(
+        self,
+        prompt: str,
+        response_format: Union[ResponseFormat, Dict[str, Any]],
+        model: str,
+        temperature: Optional[float],
+        top_p: Optional[float],
+        effort: Optional[str],
+        verbosity: Optional[str],
+        tools: Optional[List[Union[Tool, Dict[str, Any]]]],
+        tool_choice: Optional[Union[str, Dict[str, Any]]],
+        previous_response_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Validate the request parameters and build the API request body."""
+        try:
+            # Convert dict to ResponseFormat if needed; repeated formats are
+            # validated once by the ResponseFormat.get cache
+            if isinstance(response_format, dict):
+                try:
+                    response_format = ResponseFormat.get(**response_format)
+                except TypeError:
+                    # Fields get() doesn't take, or unhashable values
+                    response_format = ResponseFormat(**response_format)
+        except pydantic.ValidationError as e:
+            raise ValidationError(f"Invalid response format: {e}", "response_format")
+        
+        # Create request data with correct API structure; optional fields are
+        # only added when set
+        request_data = {
+            "model": model,
+            "input": prompt,
+            "text": _TEXT_FORMAT,
+        }
+        
+        # Add model-specific parameters
+        if model == "gpt-5":
+            # GPT-5 uses effort and verbosity instead of temperature/top_p
+            if effort:
+                request_data["reasoning"] = {
+                    "effort": effort
+                }
+            if verbosity:
+                request_data["text"] = {**_TEXT_FORMAT, "verbosity": verbosity}
+        else:
+            # Traditional models use temperature and top_p
+            if temperature is not None:
+                if not 0 <= temperature <= 2:
+                    raise ValidationError("Temperature must be between 0.0 and 2.0.", "temperature")
+                request_data["temperature"] = temperature
+            if top_p is not None:
+                if not 0 <= top_p <= 1:
+                    raise ValidationError("top_p must be between 0.0 and 1.0.", "top_p")
+                request_data["top_p"] = top_p
+        
+        # Add previous_response_id for conversation continuity
+        if previous_response_id:
+            request_data["previous_response_id"] = previous_response_id
+        
+        # Add tools if provided; dict tools are validated once per distinct tool
+        if tools:
+            try:
+                request_data["tools"] = [
+                    _tool_from_json(_json.dumps(tool)) if isinstance(tool, dict) else tool.api_dict
+                    for tool in tools
+                ]
+            except pydantic.ValidationError as e:
+                raise ValidationError(f"Invalid tool: {e}", "tools")
+        
+        # Add tool_choice if provided
+        if tool_choice:
+            request_data["tool_choice"] = tool_choice
+        
+        return request_data
+    
     def create_function_tool(
         self,
         name: str,
@@ -227,45 +645,302 @@ class OpenAIResponsesAPI:
         Raises:
             APIError: If the request fails after all retries.
         """
+        return _json.loads(self._send_request(data).content)
+    
+    def _send_request(self, data: Dict[str, Any], stream: bool = False) -> requests.Response:
+        """
+        Send a request to the OpenAI Responses API with retry logic.
+        
+        Args:
+            data: Request data to send.
+            stream: Whether to stream the response body instead of downloading it.
+            
+        Returns:
+            The successful HTTP response.
+            
+        Raises:
+            APIError: If the request fails after all retries.
+        """
+        # Serialize once; retries resend the same body
+        return self._request("POST", self.responses_endpoint, data=_json.dumps(data), stream=stream)
+    
+    def _sleep_backoff(self, attempt: int, retry_after: Optional[str] = None):
+        """Wait before retry ``attempt``, honoring a ``Retry-After`` header if given."""
+        # Randomized so clients that failed together don't retry together
+        backoff = random.uniform(0, min(self.MAX_BACKOFF, self.BASE_BACKOFF * 2 ** attempt))
+        delay = _parse_retry_after(retry_after)
+        if delay > self.MAX_RETRY_AFTER:
+            logger.warning("Retry-After of %.0fs capped at %ss", delay, self.MAX_RETRY_AFTER)
+            delay = self.MAX_RETRY_AFTER
+        time.sleep(delay + backoff)
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an HTTP request to the API with retry logic.
+        
+        Args:
+            method: HTTP method.
+            url: Full URL of the endpoint.
+            **kwargs: Passed through to ``requests.Session.request``. With
+                ``stream=True`` the body of the returned response is left unread.
+            
+        Returns:
+            The successful HTTP response.
+            
+        Raises:
+            APIError: If the request fails after all retries, or the API has
+                been failing and the client is backing off.
+            AuthenticationError: If the API key is malformed.
+        """
+        # A malformed key would only be rejected with a 401 after a full round trip
+        if self._key_malformed:
+            raise AuthenticationError("Malformed API key. OpenAI API keys start with 'sk-'.")
+        
+        guard = self._retry_guard
+        if not guard.allow_request():
+            raise APIError("The API is failing repeatedly; not sending requests for a while.")
+        
+        if method == "POST":
+            # The same key on every attempt lets the server recognise a retry
+            # of a request it already processed instead of running it twice
+            kwargs["headers"] = {"Idempotency-Key": uuid.uuid4().hex, **kwargs.get("headers", {})}
+        
+        # Every request is streamed so that an error body is never read past
+        # MAX_ERROR_BODY; a successful body is read here unless the caller streams
+        stream = kwargs.pop("stream", False)
+        
         for attempt in range(self.max_retries + 1):
             try:
-                response = self.session.post(
-                    self.responses_endpoint,
-                    json=data,
-                    timeout=self.timeout,
-                )
+                response = self.session.request(method, url, timeout=self.timeout, stream=True, **kwargs)
                 
                 # Handle different response status codes
                 if response.status_code == 200:
-                    return response.json()
+                    if not stream:
+                        # Read within the try, so a connection dropped mid-body is retried
+                        response.content
+                    guard.success()
+                    return response
+                # Bodies that aren't parsed are closed unread, returning the
+                # connection to the pool
                 elif response.status_code == 401:
+                    response.close()
                     raise AuthenticationError("Invalid API key or authentication failed.")
                 elif response.status_code == 429:
-                    if attempt < self.max_retries:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        time.sleep(retry_after)
+                    response.close()
+                    guard.throttled()
+                    if attempt < self.max_retries and guard.allow_retry():
+                        self._sleep_backoff(attempt, response.headers.get("Retry-After"))
                         continue
                     raise RateLimitError("Rate limit exceeded.")
                 elif response.status_code == 402:
+                    response.close()
                     raise QuotaExceededError("Quota exceeded.")
                 else:
-                    error_data = response.json() if response.content else {}
-                    error_message = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
+                    if response.status_code >= 500:
+                        guard.failure()
+                        if response.status_code in _RETRYABLE_STATUS and attempt < self.max_retries and guard.allow_retry():
+                            response.close()
+                            self._sleep_backoff(attempt, response.headers.get("Retry-After"))
+                            continue
+                    error_data = _error_data(response)
+                    error_message = (error_data.get("error") or {}).get("message", f"HTTP {response.status_code}")
                     raise APIError(error_message, response.status_code, error_data)
                     
             except requests.exceptions.Timeout:
-                if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                guard.failure()
+                if attempt < self.max_retries and guard.allow_retry():
+                    self._sleep_backoff(attempt)
                     continue
                 raise APIError("Request timeout")
             except requests.exceptions.RequestException as e:
-                if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)
+                guard.failure()
+                if attempt < self.max_retries and guard.allow_retry():
+                    self._sleep_backoff(attempt)
                     continue
                 raise APIError(f"Request failed: {str(e)}")
         
         raise APIError("Request failed after all retries")
     
+    def create_batch(
+        self,
+        items: List[Dict[str, Any]],
+        completion_window: str = "24h",
+    ) -> Dict[str, Any]:
+        """
+        Submit requests to the Batch API.
+        
+        Batched requests are billed at a discount and don't count against the
+        regular rate limits, but complete asynchronously within
+        ``completion_window``. Use this for work that isn't latency sensitive.
+        
+        Args:
+            items: Keyword arguments for ``generate_response``, one dict per request.
+            completion_window: Time frame within which the batch should complete.
+            
+        Returns:
+            The created batch object.
+            
+        Raises:
+            ValidationError: If request parameters are invalid.
+            APIError: If the upload or batch creation fails.
+        """
+        # Build the JSONL input file in memory; custom_id keeps the request order
+        lines = []
+        for i, request in enumerate(items):
+            _check_prompt(request["prompt"])
+            body = self._build_request_data(
+                prompt=request["prompt"],
+                response_format=request["response_format"],
+                model=request.get("model", "gpt-4o"),
+                temperature=request.get("temperature"),
+                top_p=request.get("top_p"),
+                effort=request.get("effort"),
+                verbosity=request.get("verbosity"),
+                tools=request.get("tools"),
+                tool_choice=request.get("tool_choice"),
+                previous_response_id=request.get("previous_response_id"),
+            )
+            lines.append(_json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": body,
+            }))
+        
+        # Multipart upload; drop the session's JSON content type so requests sets the boundary
+        upload = self._request(
+            "POST",
+            f"{self.base_url}/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", b"\n".join(lines), "application/jsonl")},
+            headers={"Content-Type": None},
+        )
+        file_id = _json.loads(upload.content)["id"]
+        
+        batch = self._request(
+            "POST",
+            f"{self.base_url}/batches",
+            data=_json.dumps({
+                "input_file_id": file_id,
+                "endpoint": "/v1/responses",
+                "completion_window": completion_window,
+            }),
+        )
+        return _json.loads(batch.content)
+    
+    def retrieve_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Retrieve the current state of a batch.
+        
+        Args:
+            batch_id: ID of the batch.
+            
+        Returns:
+            The batch object.
+        """
+        return _json.loads(self._request("GET", f"{self.base_url}/batches/{batch_id}").content)
+    
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 10.0,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Poll a batch until it reaches a terminal state.
+        
+        Args:
+            batch_id: ID of the batch.
+            poll_interval: Seconds to wait between polls.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+            
+        Returns:
+            The final batch object.
+            
+        Raises:
+            APIError: If the batch doesn't finish within ``timeout``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = self.retrieve_batch(batch_id)
+            if batch["status"] in ("completed", "failed", "expired", "cancelled"):
+                return batch
+            if deadline is not None and time.monotonic() >= deadline:
+                raise APIError(f"Batch {batch_id} still {batch['status']} after {timeout}s")
+            time.sleep(poll_interval)
+    
+    def get_batch_results(self, batch: Dict[str, Any]) -> List[Union[ResponseResponse, APIError]]:
+        """
+        Download the results of a finished batch.
+        
+        Args:
+            batch: Batch object returned by ``wait_for_batch`` or ``retrieve_batch``.
+            
+        Returns:
+            One entry per submitted request, in submission order: the response,
+            or an APIError if that request failed.
+            
+        Raises:
+            APIError: If the batch did not complete.
+        """
+        if batch["status"] != "completed":
+            raise APIError(f"Batch {batch['id']} is {batch['status']}", response_data=batch)
+        
+        results: Dict[str, Union[ResponseResponse, APIError]] = {}
+        for file_id in (batch.get("output_file_id"), batch.get("error_file_id")):
+            if not file_id:
+                continue
+            content = self._request("GET", f"{self.base_url}/files/{file_id}/content").content
+            for line in content.splitlines():
+                if not line:
+                    continue
+                record = _json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[record["custom_id"]] = ResponseResponse(**response["body"])
+                else:
+                    error = record.get("error") or response.get("body", {}).get("error") or {}
+                    results[record["custom_id"]] = APIError(
+                        error.get("message", "Batch request failed"),
+                        response.get("status_code"),
+                        record,
+                    )
+        
+        # Output lines are not guaranteed to be in input order
+        total = batch.get("request_counts", {}).get("total", len(results))
+        return [
+            results.get(f"request-{i}", APIError(f"No result for request-{i}"))
+            for i in range(total)
+        ]
+    
+    def _create_typed_response(
+        self,
+        response_type: str,
+        prompt: str,
+        style: Optional[str],
+        tone: Optional[str],
+        length: Optional[str],
+        tools: Optional[List[Union[Tool, Dict[str, Any]]]],
+        tool_choice: Optional[Union[str, Dict[str, Any]]],
+        previous_response_id: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> ResponseResponse:
+        """Generate a response in one of the typed formats behind the ``create_*_response`` helpers."""
+        try:
+            response_format = ResponseFormat.get(response_type, style, tone, length)
+        except pydantic.ValidationError as e:
+            raise ValidationError(f"Invalid response format: {e}", "response_format")
+        # Unknown keyword arguments have always been ignored here
+        options = {name: kwargs[name] for name in _TYPED_RESPONSE_OPTIONS if name in kwargs}
+        return self.generate_response(
+            prompt=prompt,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+            previous_response_id=previous_response_id,
+            **options,
+        )
+    
     def create_email_response(
         self,
         prompt: str,
@@ -288,37 +963,13 @@ class OpenAIResponsesAPI:
             tools: List of tools available to the model.
             tool_choice: Tool choice configuration.
             previous_response_id: ID of the previous response for conversation continuity.
-            **kwargs: Additional parameters (temperature, top_p, effort, verbosity, model).
+            **kwargs: Additional parameters (temperature, top_p, effort, verbosity, model, cache).
             
         Returns:
             ResponseResponse object containing the generated email.
         """
-        # Create response format for email
-        response_format = ResponseFormat(
-            type="email",
-            style=style,
-            tone=tone,
-            length=length
-        )
-        
-        # Extract model-specific parameters
-        model = kwargs.get("model", "gpt-4o")
-        temperature = kwargs.get("temperature")
-        top_p = kwargs.get("top_p")
-        effort = kwargs.get("effort")
-        verbosity = kwargs.get("verbosity")
-        
-        return self.generate_response(
-            prompt=prompt,
-            response_format=response_format,
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-            effort=effort,
-            verbosity=verbosity,
-            tools=tools,
-            tool_choice=tool_choice,
-            previous_response_id=previous_response_id
+        return self._create_typed_response(
+            "email", prompt, style, tone, length, tools, tool_choice, previous_response_id, kwargs
         )
     
     def create_letter_response(
@@ -343,37 +994,13 @@ class OpenAIResponsesAPI:
             tools: List of tools available to the model.
             tool_choice: Tool choice configuration.
             previous_response_id: ID of the previous response for conversation continuity.
-            **kwargs: Additional parameters (temperature, top_p, effort, verbosity, model).
+            **kwargs: Additional parameters (temperature, top_p, effort, verbosity, model, cache).
             
         Returns:
             ResponseResponse object containing the generated letter.
         """
-        # Create response format for letter
-        response_format = ResponseFormat(
-            type="letter",
-            style=style,
-            tone=tone,
-            length=length
-        )
-        
-        # Extract model-specific parameters
-        model = kwargs.get("model", "gpt-4o")
-        temperature = kwargs.get("temperature")
-        top_p = kwargs.get("top_p")
-        effort = kwargs.get("effort")
-        verbosity = kwargs.get("verbosity")
-        
-        return self.generate_response(
-            prompt=prompt,
-            response_format=response_format,
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-            effort=effort,
-            verbosity=verbosity,
-            tools=tools,
-            tool_choice=tool_choice,
-            previous_response_id=previous_response_id
+        return self._create_typed_response(
+            "letter", prompt, style, tone, length, tools, tool_choice, previous_response_id, kwargs
         )
     
     def create_message_response(
@@ -398,42 +1025,24 @@ class OpenAIResponsesAPI:
             tools: List of tools available to the model.
             tool_choice: Tool choice configuration.
             previous_response_id: ID of the previous response for conversation continuity.
-            **kwargs: Additional parameters (temperature, top_p, effort, verbosity, model).
+            **kwargs: Additional parameters (temperature, top_p, effort, verbosity, model, cache).
             
         Returns:
             ResponseResponse object containing the generated message.
         """
-        # Create response format for message
-        response_format = ResponseFormat(
-            type="message",
-            style=style,
-            tone=tone,
-            length=length
-        )
-        
-        # Extract model-specific parameters
-        model = kwargs.get("model", "gpt-4o")
-        temperature = kwargs.get("temperature")
-        top_p = kwargs.get("top_p")
-        effort = kwargs.get("effort")
-        verbosity = kwargs.get("verbosity")
-        
-        return self.generate_response(
-            prompt=prompt,
-            response_format=response_format,
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-            effort=effort,
-            verbosity=verbosity,
-            tools=tools,
-            tool_choice=tool_choice,
-            previous_response_id=previous_response_id
+        return self._create_typed_response(
+            "message", prompt, style, tone, length, tools, tool_choice, previous_response_id, kwargs
         )
     
     def close(self):
-        """Close the session and clean up resources."""
+        """
+        Close the session and clean up resources.
+        
+        Pooled connections are shared with other clients and stay open for them.
+        """
         if hasattr(self, 'session'):
+            # Unmount the shared adapter so closing the session doesn't close it
+            self.session.adapters.clear()
             self.session.close()
     
     def __enter__(self):
@@ -0,0 +1,23 @@
+"""
+Configuration shared by the clients and the demo scripts.
+"""
+
+import functools
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+@functools.cache
+def get_api_key() -> Optional[str]:
+    """
+    Return the OpenAI API key from the environment or a ``.env`` file.
+
+    The environment is read once per process; call ``get_api_key.cache_clear()``
+    to pick up a changed key.
+    """
+    # .env never overrides the environment, so only read it when it could help
+    if "OPENAI_API_KEY" not in os.environ:
+        load_dotenv()
+    return os.environ.get("OPENAI_API_KEY")
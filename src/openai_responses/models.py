@@ -2,8 +2,34 @@
 Pydantic models for OpenAI Responses API requests and responses.
 """
 
-from typing import Dict, Any, Optional, Union, List
-from pydantic import BaseModel, Field, validator
+import functools
+from typing import Annotated, ClassVar, Dict, Any, Literal, Optional, Tuple, Union, List
+from pydantic import BaseModel, BeforeValidator, Field
+
+
+def _lower(v):
+    return v.lower() if isinstance(v, str) else v
+
+
+# Allowed values are checked by pydantic-core; the response format options are
+# case-insensitive and stored lowercased
+ToolType = Literal[
+    'function',  # Custom function tools
+    'code_interpreter',  # OpenAI hosted tools
+    'file_search',
+    'web_search_preview',
+    'web_search_preview_2025_03_11',
+    'image_generation',
+    'mcp',
+    'computer_use_preview',
+]
+ResponseType = Annotated[Literal['email', 'letter', 'message', 'response', 'reply', 'note'], BeforeValidator(_lower)]
+ResponseStyle = Annotated[Literal['professional', 'casual', 'formal', 'friendly', 'business'], BeforeValidator(_lower)]
+ResponseTone = Annotated[
+    Literal['friendly', 'polite', 'assertive', 'neutral', 'enthusiastic', 'sympathetic', 'professional'],
+    BeforeValidator(_lower),
+]
+ModelName = Literal['gpt-4o', 'gpt-4o-mini', 'gpt-4-turbo', 'gpt-3.5-turbo']
 
 
 class ToolFunction(BaseModel):
@@ -17,72 +43,62 @@ class ToolFunction(BaseModel):
 class Tool(BaseModel):
     """Model for tool definition."""
     
-    type: str = Field(..., description="Type of tool (function, code_interpreter, file_search, web_search_preview, etc.)")
+    type: ToolType = Field(..., description="Type of tool (function, code_interpreter, file_search, web_search_preview, etc.)")
     function: Optional[ToolFunction] = Field(None, description="Function definition for function tools")
     
-    @validator('type')
-    def validate_type(cls, v):
-        """Validate tool type."""
-        valid_types = [
-            'function',  # Custom function tools
-            'code_interpreter',  # OpenAI hosted tools
-            'file_search',
-            'web_search_preview',
-            'web_search_preview_2025_03_11',
-            'image_generation',
-            'mcp',
-            'computer_use_preview'
-        ]
-        if v not in valid_types:
-            raise ValueError(f"Invalid tool type. Must be one of: {valid_types}")
-        return v
+    @functools.cached_property
+    def api_dict(self) -> Dict[str, Any]:
+        """
+        The tool as sent to the API, built once and reused by every request.
+        
+        Reassigning a field rebuilds it; don't modify nested values in place.
+        """
+        return self.model_dump(exclude_none=True)
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self.__dict__.pop("api_dict", None)
 
 
 class ResponseFormat(BaseModel):
     """Model for response format configuration."""
     
-    type: str = Field(..., description="Type of response format (e.g., 'email', 'letter', 'message')")
-    style: Optional[str] = Field(None, description="Style of the response (e.g., 'professional', 'casual', 'formal')")
-    tone: Optional[str] = Field(None, description="Tone of the response (e.g., 'friendly', 'polite', 'assertive')")
+    type: ResponseType = Field(..., description="Type of response format (e.g., 'email', 'letter', 'message')")
+    style: Optional[ResponseStyle] = Field(None, description="Style of the response (e.g., 'professional', 'casual', 'formal')")
+    tone: Optional[ResponseTone] = Field(None, description="Tone of the response (e.g., 'friendly', 'polite', 'assertive')")
     length: Optional[str] = Field(None, description="Desired length of response (e.g., 'short', 'medium', 'long')")
     language: Optional[str] = Field("en", description="Language code for the response")
     
     # Additional custom fields
     custom_fields: Optional[Dict[str, Any]] = Field(None, description="Additional custom format fields")
     
-    @validator('type')
-    def validate_type(cls, v):
-        """Validate response type."""
-        valid_types = ['email', 'letter', 'message', 'response', 'reply', 'note']
-        if v.lower() not in valid_types:
-            raise ValueError(f"Invalid response type. Must be one of: {valid_types}")
-        return v.lower()
-    
-    @validator('style')
-    def validate_style(cls, v):
-        """Validate response style."""
-        if v is not None:
-            valid_styles = ['professional', 'casual', 'formal', 'friendly', 'business']
-            if v.lower() not in valid_styles:
-                raise ValueError(f"Invalid style. Must be one of: {valid_styles}")
-            return v.lower()
-        return v
-    
-    @validator('tone')
-    def validate_tone(cls, v):
-        """Validate response tone."""
-        if v is not None:
-            valid_tones = ['friendly', 'polite', 'assertive', 'neutral', 'enthusiastic', 'sympathetic', 'professional']
-            if v.lower() not in valid_tones:
-                raise ValueError(f"Invalid tone. Must be one of: {valid_tones}")
-            return v.lower()
-        return v
+    @classmethod
+    def get(
+        cls,
+        type: str,
+        style: Optional[str] = None,
+        tone: Optional[str] = None,
+        length: Optional[str] = None,
+        language: Optional[str] = "en",
+    ) -> "ResponseFormat":
+        """
+        Get a validated response format, reusing the instance built for the same options.
+        
+        The returned instance is shared between callers and must not be modified.
+        """
+        # Pass positionally so keyword and positional calls share cache entries
+        return _cached_response_format(cls, type, style, tone, length, language)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_response_format(cls, type, style, tone, length, language) -> ResponseFormat:
+    return cls(type=type, style=style, tone=tone, length=length, language=language)
 
 
 class ResponseRequest(BaseModel):
     """Model for OpenAI Responses API request."""
     
-    model: str = Field(default="gpt-4o", description="OpenAI model to use")
+    model: ModelName = Field(default="gpt-4o", description="OpenAI model to use")
     prompt: str = Field(..., description="The prompt to generate a response for")
     response_format: ResponseFormat = Field(..., description="Format configuration for the response")
     temperature: Optional[float] = Field(0.7, ge=0.0, le=2.0, description="Sampling temperature")
@@ -94,14 +110,6 @@ class ResponseRequest(BaseModel):
     tools: Optional[List[Tool]] = Field(None, description="List of tools available to the model")
     tool_choice: Optional[Union[str, Dict[str, Any]]] = Field(None, description="Tool choice configuration")
     previous_response_id: Optional[str] = Field(None, description="ID of the previous response for conversation continuity")
-    
-    @validator('model')
-    def validate_model(cls, v):
-        """Validate OpenAI model."""
-        valid_models = ['gpt-4o', 'gpt-4o-mini', 'gpt-4-turbo', 'gpt-3.5-turbo']
-        if v not in valid_models:
-            raise ValueError(f"Invalid model. Must be one of: {valid_models}")
-        return v
 
 
 class ToolCall(BaseModel):
@@ -126,7 +134,15 @@ class ResponseResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Response metadata")
     text: Optional[Union[str, Dict[str, Any]]] = Field(None, description="Generated text content")
     
-    @property
+    # Derived from the fields above and computed once, on first access
+    _DERIVED: ClassVar[Tuple[str, ...]] = ("content", "finish_reason", "prompt_tokens", "completion_tokens", "total_tokens", "tool_calls")
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        for derived in self._DERIVED:
+            self.__dict__.pop(derived, None)
+    
+    @functools.cached_property
     def content(self) -> str:
         """Get the content of the response."""
         # For Responses API with tools, the content is in output[1]['content'][0]['text']
@@ -162,7 +178,7 @@ class ResponseResponse(BaseModel):
         
         return ''
     
-    @property
+    @functools.cached_property
     def finish_reason(self) -> Optional[str]:
         """Get the finish reason of the response."""
         if self.output and len(self.output) > 0:
@@ -171,28 +187,28 @@ class ResponseResponse(BaseModel):
             return self.choices[0].get('finish_reason')
         return None
     
-    @property
+    @functools.cached_property
     def prompt_tokens(self) -> int:
         """Get the number of prompt tokens used."""
         if self.usage:
             return self.usage.get('input_tokens', 0)
         return 0
     
-    @property
+    @functools.cached_property
     def completion_tokens(self) -> int:
         """Get the number of completion tokens used."""
         if self.usage:
             return self.usage.get('output_tokens', 0)
         return 0
     
-    @property
+    @functools.cached_property
     def total_tokens(self) -> int:
         """Get the total number of tokens used."""
         if self.usage:
             return self.usage.get('total_tokens', 0)
         return 0 
 
-    @property
+    @functools.cached_property
     def tool_calls(self) -> Optional[List[ToolCall]]:
         """Get tool calls from the response."""
         if not self.output:
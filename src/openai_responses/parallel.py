@@ -0,0 +1,97 @@
+"""
+Rate-limited parallel request processing for OpenAI Responses API.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Union
+
+from .async_client import AsyncOpenAIResponsesAPI
+from .client import OpenAIResponsesAPI
+from .models import ResponseResponse
+from .exceptions import OpenAIResponsesError, RateLimitError
+
+
+# Rough token estimate used for TPM budgeting before a request is sent
+CHARS_PER_TOKEN = 4
+
+
+class _Bucket:
+    """Token bucket holding one minute of capacity, refilled continuously."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.available = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    async def acquire(self, amount: float):
+        """Wait until ``amount`` units are available, then take them."""
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.available >= amount:
+                self.available -= amount
+                return
+            await asyncio.sleep((amount - self.available) * 60 / self.capacity)
+
+
+def _estimate_tokens(request: Dict[str, Any], expected_output_tokens: int) -> int:
+    """Estimate the tokens a request will consume, prompt plus expected output."""
+    return len(request.get("prompt", "")) // CHARS_PER_TOKEN + expected_output_tokens
+
+
+async def run_parallel(
+    api: AsyncOpenAIResponsesAPI,
+    requests: List[Dict[str, Any]],
+    max_rpm: float = 500,
+    max_tpm: float = 200_000,
+    max_concurrency: int = 20,
+    max_attempts: int = 5,
+    expected_output_tokens: int = 1000,
+) -> List[Union[ResponseResponse, OpenAIResponsesError]]:
+    """
+    Generate many responses concurrently while staying under rate limits.
+
+    Requests are admitted through requests-per-minute and tokens-per-minute
+    buckets and at most ``max_concurrency`` run at once. A request that still
+    hits a rate limit is retried with jittered exponential backoff.
+
+    Args:
+        api: Async client used to send the requests.
+        requests: Keyword arguments for ``generate_response``, one dict per request.
+        max_rpm: Maximum requests started per minute.
+        max_tpm: Maximum estimated tokens used per minute.
+        max_concurrency: Maximum requests in flight at once.
+        max_attempts: Attempts per request before a RateLimitError is returned.
+        expected_output_tokens: Output tokens assumed per request for TPM budgeting.
+
+    Returns:
+        One entry per request, in order: the response, or the error it failed with.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    request_bucket = _Bucket(max_rpm)
+    token_bucket = _Bucket(max_tpm)
+
+    async def run_one(request: Dict[str, Any]) -> Union[ResponseResponse, OpenAIResponsesError]:
+        tokens = _estimate_tokens(request, expected_output_tokens)
+        async with semaphore:
+            for attempt in range(max_attempts):
+                await request_bucket.acquire(1)
+                await token_bucket.acquire(tokens)
+                try:
+                    return await api.generate_response(**request)
+                except RateLimitError as e:
+                    if attempt == max_attempts - 1:
+                        return e
+                    backoff = min(OpenAIResponsesAPI.MAX_BACKOFF, OpenAIResponsesAPI.BASE_BACKOFF * 2 ** attempt)
+                    await asyncio.sleep(random.uniform(0, backoff))
+                except OpenAIResponsesError as e:
+                    return e
+
+    return await asyncio.gather(*(run_one(request) for request in requests))
@@ -0,0 +1,71 @@
+"""
+Streaming support for OpenAI Responses API.
+"""
+
+from typing import Dict, Any, Iterator, Optional
+
+import requests
+
+from . import _json
+from .models import ResponseResponse
+from .exceptions import APIError
+
+
+class ResponseStream:
+    """
+    Iterator over a streamed response.
+
+    Iterating yields text deltas as the server emits them. Once the stream is
+    exhausted, the complete response is available as ``response``.
+    """
+
+    def __init__(self, http_response: requests.Response):
+        """
+        Initialize the stream.
+
+        Args:
+            http_response: Successful HTTP response opened with ``stream=True``.
+        """
+        self._http_response = http_response
+        self.response: Optional[ResponseResponse] = None
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield text deltas until the response completes."""
+        try:
+            for event in self._iter_events():
+                event_type = event.get("type")
+                if event_type == "response.output_text.delta":
+                    yield event.get("delta", "")
+                elif event_type in ("response.completed", "response.incomplete"):
+                    self.response = ResponseResponse(**event["response"])
+                elif event_type in ("response.failed", "error"):
+                    error = event.get("error") or event.get("response", {}).get("error") or {}
+                    raise APIError(error.get("message", "Streaming response failed"), None, event)
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Stream interrupted: {str(e)}")
+        finally:
+            self.close()
+
+    def _iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Parse server-sent events into their JSON payloads."""
+        # Lines stay bytes: SSE is always UTF-8, which the JSON parser decodes,
+        # whereas requests would guess ISO-8859-1 for text/event-stream
+        for line in self._http_response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[len(b"data:"):].strip()
+            if data == b"[DONE]":
+                break
+            yield _json.loads(data)
+
+    def close(self):
+        """Close the underlying HTTP response."""
+        self._http_response.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
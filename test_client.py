@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the OpenAI Responses API client, with the network mocked out.
+"""
+
+import email.utils
+import io
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+import requests
+
+# Test the source tree, ahead of any installed copy of the package
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from openai_responses import AsyncOpenAIResponsesAPI, OpenAIResponsesAPI
+from openai_responses.client import MAX_ERROR_BODY, _RetryGuard, _parse_retry_after
+from openai_responses.exceptions import (
+    APIError,
+    AuthenticationError,
+    QuotaExceededError,
+    RateLimitError,
+    ValidationError,
+)
+
+API_KEY = "sk-" + "a" * 30
+
+
+def make_response(status=200, content=b'{"id": "resp_1", "output": []}', headers=None):
+    """Build a requests.Response as the session would return it."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+class ShortReads(io.RawIOBase):
+    """Unread response body that hands out at most ``size`` bytes per read, like chunked transfers."""
+
+    def __init__(self, body, size=8):
+        self.body = io.BytesIO(body)
+        self.size = size
+
+    def readable(self):
+        return True
+
+    def read(self, n=-1):
+        return self.body.read(min(n, self.size) if n >= 0 else self.size)
+
+
+def make_streamed_response(status, body, size=8):
+    """Build a requests.Response whose body is still unread, as with stream=True."""
+    response = requests.Response()
+    response.status_code = status
+    response.raw = ShortReads(body, size)
+    return response
+
+
+def make_api(responses, **kwargs):
+    """Create a client whose session returns ``responses`` in turn."""
+    api = OpenAIResponsesAPI(api_key=API_KEY, **kwargs)
+    api.session.request = mock.Mock(side_effect=responses)
+    return api
+
+
+def test_retry_budget_exhaustion():
+    """Retries stop once more than half the budget has been spent."""
+    guard = _RetryGuard(budget=4, threshold=100)
+    assert guard.allow_retry()
+    guard.failure()
+    assert guard.allow_retry()
+    guard.failure()
+    assert not guard.allow_retry()
+    # Each success earns back a tenth of a token
+    for _ in range(10):
+        guard.success()
+    assert guard.allow_retry()
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """The breaker opens after ``threshold`` consecutive failures, and a success resets the count."""
+    guard = _RetryGuard(threshold=3, cooldown=30)
+    guard.failure()
+    guard.failure()
+    guard.success()
+    guard.failure()
+    guard.failure()
+    assert guard.allow_request()
+    guard.failure()
+    assert not guard.allow_request()
+    assert not guard.allow_retry()
+
+
+def test_breaker_cooldown_and_recovery():
+    """After the cooldown requests are allowed again, and one failure doesn't reopen the breaker."""
+    now = [1000.0]
+    with mock.patch("openai_responses.client.time.monotonic", lambda: now[0]):
+        guard = _RetryGuard(threshold=2, cooldown=30)
+        guard.failure()
+        guard.failure()
+        assert not guard.allow_request()
+
+        now[0] += 29
+        assert not guard.allow_request()
+        now[0] += 1
+        assert guard.allow_request()
+
+        guard.failure()
+        assert guard.allow_request()
+        guard.success()
+        guard.failure()
+        assert guard.allow_request()
+
+
+def test_open_breaker_fails_fast():
+    """While the breaker is open no request is sent."""
+    api = make_api([make_response(500, b"{}")] * 10, max_retries=0)
+    for _ in range(5):
+        try:
+            api.generate_response("Hi", {"type": "message"})
+        except APIError as e:
+            assert e.status_code == 500
+
+    try:
+        api.generate_response("Hi", {"type": "message"})
+        raise AssertionError("expected APIError")
+    except APIError as e:
+        assert "failing repeatedly" in str(e)
+    assert api.session.request.call_count == 5
+
+
+def test_rate_limits_do_not_open_breaker():
+    """A run of 429s surfaces as RateLimitError every time, never as an open breaker."""
+    api = make_api([make_response(429, b"{}")] * 20, max_retries=0)
+    for _ in range(10):
+        try:
+            api.generate_response("Hi", {"type": "message"})
+            raise AssertionError("expected RateLimitError")
+        except RateLimitError:
+            pass
+    assert api._retry_guard.allow_request()
+    assert api.session.request.call_count == 10
+
+
+def test_cache_hit_returns_copy():
+    """temperature=0 requests are served from the cache, as copies the caller can modify."""
+    content = b'{"id": "resp_1", "output": [{"type": "message", "content": [{"text": "hi"}]}]}'
+    api = make_api([make_response(content=content)])
+    first = api.generate_response("Hi", {"type": "message"}, temperature=0)
+    first.output[0]["content"][0]["text"] = "changed"
+    second = api.generate_response("Hi", {"type": "message"}, temperature=0)
+    assert second.content == "hi"
+    assert second is not first
+    assert api.session.request.call_count == 1
+
+
+def test_cache_is_opt_in_for_sampled_requests():
+    """Sampled requests are only cached with cache=True; cache=False always sends."""
+    api = make_api([make_response() for _ in range(4)])
+    api.generate_response("Hi", {"type": "message"}, temperature=0.7)
+    api.generate_response("Hi", {"type": "message"}, temperature=0.7)
+    assert api.session.request.call_count == 2
+    api.generate_response("Hi", {"type": "message"}, temperature=0.7, cache=True)
+    api.generate_response("Hi", {"type": "message"}, temperature=0.7, cache=True)
+    assert api.session.request.call_count == 3
+    api.generate_response("Hi", {"type": "message"}, temperature=0.7, cache=False)
+    assert api.session.request.call_count == 4
+
+
+def test_cache_ttl_expires_entries():
+    """A cached response is not served after cache_ttl seconds."""
+    now = [1000.0]
+    with mock.patch("openai_responses.client.time.monotonic", lambda: now[0]):
+        api = make_api([make_response(), make_response()], cache_ttl=60)
+        api.generate_response("Hi", {"type": "message"}, temperature=0)
+        now[0] += 59
+        api.generate_response("Hi", {"type": "message"}, temperature=0)
+        assert api.session.request.call_count == 1
+        now[0] += 1
+        api.generate_response("Hi", {"type": "message"}, temperature=0)
+        assert api.session.request.call_count == 2
+
+
+def test_cache_size_zero_disables_cache():
+    """With cache_size=0 every request calls the API, even at temperature=0 or with cache=True."""
+    api = make_api([make_response() for _ in range(3)], cache_size=0)
+    api.generate_response("Hi", {"type": "message"}, temperature=0)
+    api.generate_response("Hi", {"type": "message"}, temperature=0)
+    api.generate_response("Hi", {"type": "message"}, temperature=0, cache=True)
+    assert api.session.request.call_count == 3
+
+
+def test_async_client_forwards_cache_settings():
+    """AsyncOpenAIResponsesAPI passes cache_size and cache_ttl to its client."""
+    api = AsyncOpenAIResponsesAPI(api_key=API_KEY, cache_size=0, cache_ttl=5)
+    assert api.client._cache.max_entries == 0
+    assert api.client._cache.ttl == 5
+    api.close()
+
+
+def test_error_body_read_across_chunks():
+    """A JSON error body arriving in several reads is parsed whole."""
+    body = b'{"error": {"message": "The model does not exist."}}'
+    api = make_api([make_streamed_response(404, body)])
+    try:
+        api.generate_response("Hi", {"type": "message"})
+        raise AssertionError("expected APIError")
+    except APIError as e:
+        assert e.status_code == 404
+        assert str(e) == "The model does not exist."
+
+
+def test_error_body_read_is_bounded():
+    """At most MAX_ERROR_BODY bytes of an error body are read."""
+    response = make_streamed_response(400, b"x" * (4 * MAX_ERROR_BODY), size=MAX_ERROR_BODY // 2)
+    api = make_api([response])
+    try:
+        api.generate_response("Hi", {"type": "message"})
+        raise AssertionError("expected APIError")
+    except APIError as e:
+        assert str(e) == "HTTP 400"
+    assert response.raw.body.tell() == MAX_ERROR_BODY
+
+
+def test_successful_body_is_read_unless_streaming():
+    """Requests are sent streamed; the client reads the body itself for non-streaming calls."""
+    api = make_api([make_streamed_response(200, b'{"id": "resp_1", "output": []}')])
+    assert api.generate_response("Hi", {"type": "message"}).id == "resp_1"
+    assert api.session.request.call_args.kwargs["stream"] is True
+
+
+def test_unparsed_error_responses_are_closed():
+    """Responses that are retried or raised without reading the body are closed."""
+    responses = [make_streamed_response(status, b"{}") for status in (503, 429, 200, 401, 402)]
+    api = make_api(responses)
+    with mock.patch("openai_responses.client.time.sleep"):
+        api.generate_response_stream("Hi", {"type": "message"})
+        for error in (AuthenticationError, QuotaExceededError):
+            try:
+                api.generate_response("Hi", {"type": "message"})
+                raise AssertionError(f"expected {error.__name__}")
+            except error:
+                pass
+    assert [response.raw.closed for response in responses] == [True, True, False, True, True]
+
+
+def test_5xx_retry_keeps_idempotency_key():
+    """A retried 503 is resent with the same Idempotency-Key; a new call gets a new key."""
+    api = make_api([make_response(503, b"{}"), make_response(), make_response()])
+    with mock.patch("openai_responses.client.time.sleep"):
+        api.generate_response("Hi", {"type": "message"})
+        api.generate_response("Hello", {"type": "message"})
+    keys = [call.kwargs["headers"]["Idempotency-Key"] for call in api.session.request.call_args_list]
+    assert keys[0] == keys[1]
+    assert keys[2] != keys[0]
+
+
+def test_non_retryable_5xx_fails_immediately():
+    """A 501 is not retried."""
+    api = make_api([make_response(501, b'{"error": {"message": "nope"}}')])
+    try:
+        api.generate_response("Hi", {"type": "message"})
+        raise AssertionError("expected APIError")
+    except APIError as e:
+        assert e.status_code == 501
+        assert str(e) == "nope"
+    assert api.session.request.call_count == 1
+
+
+def test_parse_retry_after():
+    """Retry-After is accepted in seconds or as an HTTP date, never negative."""
+    assert _parse_retry_after(None) == 0.0
+    assert _parse_retry_after("7") == 7.0
+    assert _parse_retry_after("garbage") == 0.0
+    future = email.utils.formatdate(time.time() + 20, usegmt=True)
+    assert 18 <= _parse_retry_after(future) <= 20
+    past = email.utils.formatdate(time.time() - 20, usegmt=True)
+    assert _parse_retry_after(past) == 0.0
+
+
+def test_retry_after_http_date_is_honored():
+    """A 429 with an HTTP-date Retry-After waits until that time (plus jitter) before retrying."""
+    retry_at = email.utils.formatdate(time.time() + 10, usegmt=True)
+    api = make_api([make_response(429, b"{}", {"Retry-After": retry_at}), make_response()])
+    with mock.patch("openai_responses.client.time.sleep") as sleep:
+        api.generate_response("Hi", {"type": "message"})
+    (delay,), _ = sleep.call_args
+    assert 8 <= delay <= 10 + api.BASE_BACKOFF
+
+
+def test_retry_after_is_capped():
+    """A Retry-After beyond MAX_RETRY_AFTER is capped."""
+    api = make_api([make_response(503, b"{}", {"Retry-After": "3600"}), make_response()])
+    with mock.patch("openai_responses.client.time.sleep") as sleep:
+        api.generate_response("Hi", {"type": "message"})
+    (delay,), _ = sleep.call_args
+    assert api.MAX_RETRY_AFTER <= delay <= api.MAX_RETRY_AFTER + api.BASE_BACKOFF
+
+
+def test_specialize_builds_template_once():
+    """A specialized generator sends the fixed settings with each prompt."""
+    api = make_api([make_response(), make_response()])
+    generate = api.specialize("email", style="formal", model="gpt-4o-mini", temperature=0.2)
+    generate("First")
+    generate("Second")
+    bodies = [json.loads(call.kwargs["data"]) for call in api.session.request.call_args_list]
+    assert [body["input"] for body in bodies] == ["First", "Second"]
+    assert all(body["model"] == "gpt-4o-mini" and body["temperature"] == 0.2 for body in bodies)
+
+
+def test_specialize_rejects_invalid_format():
+    """An invalid style raises the package's ValidationError before anything is sent."""
+    api = make_api([])
+    try:
+        api.specialize("letter", "bogus")
+        raise AssertionError("expected ValidationError")
+    except ValidationError as e:
+        assert e.field == "response_format"
+    assert api.session.request.call_count == 0
+
+
+def test_typed_helpers_reject_invalid_format():
+    """The create_*_response helpers raise the package's ValidationError for an invalid style."""
+    api = make_api([])
+    for create in (api.create_email_response, api.create_letter_response, api.create_message_response):
+        try:
+            create("Hi", style="bogus")
+            raise AssertionError(f"expected ValidationError from {create.__name__}")
+        except ValidationError as e:
+            assert e.field == "response_format"
+    assert api.session.request.call_count == 0
+
+
+def test_typed_helpers_pass_options_through():
+    """The create_*_response helpers pass generate_response options through and drop unknown ones."""
+    api = make_api([make_response()])
+    api.create_letter_response("Hi", style="formal", temperature=0.3, unknown_option=True)
+    body = json.loads(api.session.request.call_args.kwargs["data"])
+    assert body["input"] == "Hi"
+    assert body["temperature"] == 0.3
+    assert "unknown_option" not in body
+
+
+def test_create_batch_uploads_jsonl():
+    """create_batch uploads one /v1/responses request per item, then creates the batch."""
+    api = make_api([
+        make_response(content=b'{"id": "file_1"}'),
+        make_response(content=b'{"id": "batch_1", "status": "validating"}'),
+    ])
+    batch = api.create_batch([
+        {"prompt": "One", "response_format": {"type": "message"}},
+        {"prompt": "Two", "response_format": {"type": "message"}},
+    ])
+    assert batch["id"] == "batch_1"
+    upload, create = api.session.request.call_args_list
+    lines = upload.kwargs["files"]["file"][1].decode().splitlines()
+    requests_sent = [json.loads(line) for line in lines]
+    assert [r["custom_id"] for r in requests_sent] == ["request-0", "request-1"]
+    assert all(r["url"] == "/v1/responses" for r in requests_sent)
+    assert [r["body"]["input"] for r in requests_sent] == ["One", "Two"]
+    assert json.loads(create.kwargs["data"])["input_file_id"] == "file_1"
+
+
+def test_batch_results_in_submission_order():
+    """Batch output and error files are merged back into submission order."""
+    output = b"\n".join(json.dumps(record).encode() for record in [
+        {"custom_id": "request-2", "response": {"status_code": 200, "body": {"id": "resp_2", "output": []}}},
+        {"custom_id": "request-0", "response": {"status_code": 200, "body": {"id": "resp_0", "output": []}}},
+    ])
+    errors = json.dumps({
+        "custom_id": "request-1",
+        "response": {"status_code": 400, "body": {"error": {"message": "bad request"}}},
+    }).encode()
+    api = make_api([make_response(content=output), make_response(content=errors)])
+    results = api.get_batch_results({
+        "id": "batch_1",
+        "status": "completed",
+        "output_file_id": "file_out",
+        "error_file_id": "file_err",
+        "request_counts": {"total": 4},
+    })
+    assert [r.id for r in results[0::2][:2]] == ["resp_0", "resp_2"]
+    assert isinstance(results[1], APIError) and results[1].status_code == 400
+    assert str(results[1]) == "bad request"
+    assert isinstance(results[3], APIError)
+
+
+def test_batch_results_require_completed_batch():
+    """Results can only be fetched from a completed batch."""
+    api = make_api([])
+    try:
+        api.get_batch_results({"id": "batch_1", "status": "failed"})
+        raise AssertionError("expected APIError")
+    except APIError:
+        pass
+    assert api.session.request.call_count == 0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
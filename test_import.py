@@ -7,8 +7,10 @@ Simple test script to verify the OpenAI Responses API package can be imported.
 import sys
 import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Test the source tree, ahead of any installed copy of the package
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 def test_imports():
     """Test that all modules can be imported successfully."""
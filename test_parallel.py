@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit tests for rate-limited parallel request processing, on a simulated clock.
+"""
+
+import asyncio
+import os
+import sys
+import types
+from unittest import mock
+
+# Test the source tree, ahead of any installed copy of the package
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from openai_responses import parallel
+from openai_responses.exceptions import APIError, RateLimitError
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+    def patch(self):
+        return mock.patch.multiple(
+            parallel,
+            time=types.SimpleNamespace(monotonic=self.monotonic),
+            asyncio=types.SimpleNamespace(sleep=self.sleep, Semaphore=asyncio.Semaphore, gather=asyncio.gather),
+        )
+
+
+class FakeAPI:
+    """Async client stub that records when each request starts and plays back ``outcomes`` per prompt."""
+
+    def __init__(self, clock, outcomes=None):
+        self.clock = clock
+        self.outcomes = outcomes or {}
+        self.started = []
+
+    async def generate_response(self, prompt, **kwargs):
+        self.started.append((prompt, self.clock.now))
+        outcome = self.outcomes.get(prompt, [])
+        if outcome:
+            result = outcome.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return f"response to {prompt}"
+
+
+def test_bucket_throttles_to_rate():
+    """A full bucket admits its capacity at once, then refills at capacity per minute."""
+    clock = FakeClock()
+
+    async def run():
+        bucket = parallel._Bucket(60)
+        for _ in range(60):
+            await bucket.acquire(1)
+        assert clock.sleeps == []
+        await bucket.acquire(1)
+        assert clock.sleeps == [1.0]
+        await bucket.acquire(30)
+        assert clock.now == 31.0
+
+    with clock.patch():
+        asyncio.run(run())
+
+
+def test_bucket_caps_oversized_requests():
+    """A request larger than the bucket waits for a full bucket rather than forever."""
+    clock = FakeClock()
+
+    async def run():
+        bucket = parallel._Bucket(10)
+        await bucket.acquire(1)
+        await bucket.acquire(50)
+        assert clock.now == 6.0
+
+    with clock.patch():
+        asyncio.run(run())
+
+
+def test_run_parallel_spaces_requests_by_rpm():
+    """With max_rpm=2 the third and fourth requests start 30s apart."""
+    clock = FakeClock()
+    api = FakeAPI(clock)
+    requests = [{"prompt": f"p{i}"} for i in range(4)]
+    with clock.patch():
+        results = asyncio.run(parallel.run_parallel(api, requests, max_rpm=2))
+    assert results == [f"response to p{i}" for i in range(4)]
+    assert [start for _, start in api.started] == [0.0, 0.0, 30.0, 60.0]
+
+
+def test_run_parallel_budgets_tokens():
+    """Requests wait on the tokens-per-minute bucket using the estimated tokens."""
+    clock = FakeClock()
+    api = FakeAPI(clock)
+    requests = [{"prompt": "x" * 400} for _ in range(3)]
+    with clock.patch():
+        asyncio.run(parallel.run_parallel(api, requests, max_tpm=200, expected_output_tokens=0))
+    # Each request is estimated at 100 tokens, so the third waits 30s for a refill
+    assert [start for _, start in api.started] == [0.0, 0.0, 30.0]
+
+
+def test_run_parallel_retries_rate_limits():
+    """A RateLimitError is retried; other errors are returned in place without a retry."""
+    clock = FakeClock()
+    api = FakeAPI(clock, {
+        "limited": [RateLimitError(), RateLimitError()],
+        "broken": [APIError("bad request", 400)],
+    })
+    requests = [{"prompt": "limited"}, {"prompt": "broken"}, {"prompt": "fine"}]
+    with clock.patch():
+        results = asyncio.run(parallel.run_parallel(api, requests))
+    assert results[0] == "response to limited"
+    assert isinstance(results[1], APIError) and results[1].status_code == 400
+    assert results[2] == "response to fine"
+    assert [prompt for prompt, _ in api.started].count("limited") == 3
+    assert [prompt for prompt, _ in api.started].count("broken") == 1
+
+
+def test_run_parallel_gives_up_after_max_attempts():
+    """A request still rate limited after max_attempts returns its RateLimitError."""
+    clock = FakeClock()
+    api = FakeAPI(clock, {"limited": [RateLimitError() for _ in range(5)]})
+    with clock.patch():
+        results = asyncio.run(parallel.run_parallel(api, [{"prompt": "limited"}], max_attempts=3))
+    assert isinstance(results[0], RateLimitError)
+    assert len(api.started) == 3
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for parsing streamed (server-sent event) responses.
+"""
+
+import io
+import json
+import os
+import sys
+
+import requests
+
+# Test the source tree, ahead of any installed copy of the package
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from openai_responses import ResponseStream
+from openai_responses.exceptions import APIError
+
+COMPLETED = {
+    "id": "resp_1",
+    "output": [{"type": "message", "content": [{"type": "output_text", "text": "héllo ✓"}]}],
+    "usage": {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+}
+
+
+def make_stream(events, trailer=b"", content_type="text/event-stream"):
+    """Wrap server-sent events in a streamed HTTP response, encoded as the API sends them."""
+    body = "".join(
+        f"event: {event.get('type', 'message')}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        for event in events
+    )
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.raw = io.BytesIO(body.encode("utf-8") + trailer)
+    # As requests' HTTPAdapter sets it: ISO-8859-1 for text/* without a charset
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return ResponseStream(response)
+
+
+def test_deltas_and_final_response():
+    """Deltas are yielded in order and the completed response is kept."""
+    stream = make_stream([
+        {"type": "response.created", "response": {"id": "resp_1"}},
+        {"type": "response.output_text.delta", "delta": "Hello "},
+        {"type": "response.output_text.delta", "delta": "world"},
+        {"type": "response.completed", "response": COMPLETED},
+    ])
+    assert list(stream) == ["Hello ", "world"]
+    assert stream.response.id == "resp_1"
+    assert stream.response.total_tokens == 5
+
+
+def test_non_ascii_deltas_decode_as_utf8():
+    """Without a charset the stream is still decoded as UTF-8, not ISO-8859-1."""
+    stream = make_stream([
+        {"type": "response.output_text.delta", "delta": "héllo "},
+        {"type": "response.output_text.delta", "delta": "✓ 日本"},
+        {"type": "response.completed", "response": COMPLETED},
+    ])
+    assert "".join(stream) == "héllo ✓ 日本"
+    assert stream.response.content == "héllo ✓"
+
+
+def test_done_sentinel_ends_stream():
+    """A [DONE] line stops iteration; later lines are ignored."""
+    stream = make_stream(
+        [{"type": "response.output_text.delta", "delta": "a"}],
+        trailer=b'data: [DONE]\n\ndata: {"type": "response.output_text.delta", "delta": "b"}\n\n',
+    )
+    assert list(stream) == ["a"]
+    assert stream.response is None
+
+
+def test_failed_event_raises():
+    """A response.failed event is raised as an APIError with the server's message."""
+    stream = make_stream([
+        {"type": "response.output_text.delta", "delta": "a"},
+        {"type": "response.failed", "response": {"error": {"message": "server exploded"}}},
+    ])
+    try:
+        list(stream)
+        raise AssertionError("expected APIError")
+    except APIError as e:
+        assert "server exploded" in str(e)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
@@ -6,8 +6,10 @@ Simple test for tool calling functionality.
 import os
 import sys
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Test the source tree, ahead of any installed copy of the package
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from openai_responses import OpenAIResponsesAPI, Tool, ToolFunction
 
@@ -6,19 +6,31 @@ This example demonstrates how to use function tools and hosted tools
 with the OpenAI Responses API.
 """
 
+import asyncio
+import functools
+import importlib.util
+import io
 import os
 import sys
-import json
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Use the installed package (pip install -e .); otherwise fall back to the
+# source tree, searched last so other imports don't stat it first
+if importlib.util.find_spec("openai_responses") is None:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-from openai_responses import OpenAIResponsesAPI, Tool, ToolFunction
+from openai_responses.config import get_api_key
 
+# The client stack (requests, pydantic) is imported where it is used, so the
+# banner and key warning print before paying for it
+if TYPE_CHECKING:
+    from openai_responses import AsyncOpenAIResponsesAPI, Tool
 
-def create_weather_function_tool() -> Tool:
+
+@functools.cache
+def create_weather_function_tool() -> "Tool":
     """Create a weather function tool."""
+    from openai_responses import Tool, ToolFunction
     
     weather_parameters = {
         "type": "object",
@@ -46,8 +58,10 @@ def create_weather_function_tool() -> Tool:
     )
 
 
-def create_calculator_function_tool() -> Tool:
+@functools.cache
+def create_calculator_function_tool() -> "Tool":
     """Create a calculator function tool."""
+    from openai_responses import Tool, ToolFunction
     
     calculator_parameters = {
         "type": "object",
@@ -79,8 +93,10 @@ def create_calculator_function_tool() -> Tool:
     )
 
 
-def create_hosted_tool_example() -> Tool:
+@functools.cache
+def create_hosted_tool_example() -> "Tool":
     """Create a hosted tool reference."""
+    from openai_responses import Tool
     
     # This would be a real hosted tool ID from your OpenAI account
     # For demonstration, we'll use a placeholder
@@ -89,25 +105,23 @@ def create_hosted_tool_example() -> Tool:
     return Tool(type=hosted_tool_id)
 
 
-def demo_function_tools():
+async def demo_function_tools(api: "AsyncOpenAIResponsesAPI") -> str:
     """Demonstrate function tools."""
-    print("=" * 60)
-    print("Function Tools Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("Function Tools Demo", file=out)
+    print("=" * 60, file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
         # Create function tools
         weather_tool = create_weather_function_tool()
         calculator_tool = create_calculator_function_tool()
         
         # Example 1: Weather tool
-        print("\n1. Weather Tool Example")
-        print("-" * 30)
+        print("\n1. Weather Tool Example", file=out)
+        print("-" * 30, file=out)
         
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="What's the weather like in New York City? Please provide a detailed response.",
             response_format={
                 "type": "message",
@@ -118,22 +132,22 @@ def demo_function_tools():
             tool_choice="auto"
         )
         
-        print(f"Response: {response.content}")
+        print(f"Response: {response.content}", file=out)
         
         # Check for tool calls
         if response.tool_calls:
-            print(f"\nTool calls made: {len(response.tool_calls)}")
+            print(f"\nTool calls made: {len(response.tool_calls)}", file=out)
             for tool_call in response.tool_calls:
-                print(f"Tool call ID: {tool_call.id}")
-                print(f"Tool call type: {tool_call.type}")
+                print(f"Tool call ID: {tool_call.id}", file=out)
+                print(f"Tool call type: {tool_call.type}", file=out)
                 if tool_call.function:
-                    print(f"Function: {tool_call.function}")
+                    print(f"Function: {tool_call.function}", file=out)
         
         # Example 2: Calculator tool
-        print("\n2. Calculator Tool Example")
-        print("-" * 30)
+        print("\n2. Calculator Tool Example", file=out)
+        print("-" * 30, file=out)
         
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="Calculate 15 * 23 and explain the result in a friendly way.",
             response_format={
                 "type": "message",
@@ -144,13 +158,13 @@ def demo_function_tools():
             tool_choice="auto"
         )
         
-        print(f"Response: {response.content}")
+        print(f"Response: {response.content}", file=out)
         
         # Example 3: Multiple tools
-        print("\n3. Multiple Tools Example")
-        print("-" * 30)
+        print("\n3. Multiple Tools Example", file=out)
+        print("-" * 30, file=out)
         
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="What's the weather in London and what's 100 divided by 5?",
             response_format={
                 "type": "message",
@@ -161,30 +175,30 @@ def demo_function_tools():
             tool_choice="auto"
         )
         
-        print(f"Response: {response.content}")
+        print(f"Response: {response.content}", file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    
+    return out.getvalue()
 
 
-def demo_hosted_tools():
+async def demo_hosted_tools(api: "AsyncOpenAIResponsesAPI") -> str:
     """Demonstrate hosted tools."""
-    print("\n" + "=" * 60)
-    print("Hosted Tools Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    print("\n" + "=" * 60, file=out)
+    print("Hosted Tools Demo", file=out)
+    print("=" * 60, file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
         # Create hosted tool reference
         web_search_tool = create_hosted_tool_example()
         
-        print("\nUsing OpenAI's web_search_preview hosted tool.")
-        print("This tool allows the model to search the web for current information.")
+        print("\nUsing OpenAI's web_search_preview hosted tool.", file=out)
+        print("This tool allows the model to search the web for current information.", file=out)
         
         # Example with hosted tool
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="Search for the latest news about AI developments and summarize the key points.",
             response_format={
                 "type": "message",
@@ -195,94 +209,94 @@ def demo_hosted_tools():
             tool_choice="auto"
         )
         
-        print(f"\nResponse: {response.content}")
+        print(f"\nResponse: {response.content}", file=out)
         
         if response.tool_calls:
-            print(f"\nHosted tool calls made: {len(response.tool_calls)}")
+            print(f"\nHosted tool calls made: {len(response.tool_calls)}", file=out)
             for tool_call in response.tool_calls:
-                print(f"Tool call ID: {tool_call.id}")
-                print(f"Tool call type: {tool_call.type}")
+                print(f"Tool call ID: {tool_call.id}", file=out)
+                print(f"Tool call type: {tool_call.type}", file=out)
                 if tool_call.hosted_tool:
-                    print(f"Hosted tool: {tool_call.hosted_tool}")
+                    print(f"Hosted tool: {tool_call.hosted_tool}", file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    
+    return out.getvalue()
 
 
-def demo_tool_choice_options():
+async def demo_tool_choice_options(api: "AsyncOpenAIResponsesAPI") -> str:
     """Demonstrate different tool choice options."""
-    print("\n" + "=" * 60)
-    print("Tool Choice Options Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    print("\n" + "=" * 60, file=out)
+    print("Tool Choice Options Demo", file=out)
+    print("=" * 60, file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
         # Create function tool
         weather_tool = create_weather_function_tool()
         
         # Example 1: Auto tool choice (let model decide)
-        print("\n1. Auto Tool Choice")
-        print("-" * 20)
+        print("\n1. Auto Tool Choice", file=out)
+        print("-" * 20, file=out)
         
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="What's the weather like in Tokyo?",
             response_format={"type": "message", "style": "casual"},
             tools=[weather_tool],
             tool_choice="auto"
         )
         
-        print(f"Response: {response.content}")
+        print(f"Response: {response.content}", file=out)
         
         # Example 2: None tool choice (no tools used)
-        print("\n2. None Tool Choice")
-        print("-" * 20)
+        print("\n2. None Tool Choice", file=out)
+        print("-" * 20, file=out)
         
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="What's the weather like in Tokyo?",
             response_format={"type": "message", "style": "casual"},
             tools=[weather_tool],
             tool_choice="none"
         )
         
-        print(f"Response: {response.content}")
+        print(f"Response: {response.content}", file=out)
         
         # Example 3: Specific tool choice
-        print("\n3. Specific Tool Choice")
-        print("-" * 20)
+        print("\n3. Specific Tool Choice", file=out)
+        print("-" * 20, file=out)
         
-        response = api.generate_response(
+        response = await api.generate_response(
             prompt="What's the weather like in Tokyo?",
             response_format={"type": "message", "style": "casual"},
             tools=[weather_tool],
             tool_choice={"type": "function", "function": {"name": "get_weather"}}
         )
         
-        print(f"Response: {response.content}")
+        print(f"Response: {response.content}", file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    
+    return out.getvalue()
 
 
-def demo_integration_with_response_methods():
+async def demo_integration_with_response_methods(api: "AsyncOpenAIResponsesAPI") -> str:
     """Demonstrate tool calling with response-specific methods."""
-    print("\n" + "=" * 60)
-    print("Integration with Response Methods Demo")
-    print("=" * 60)
+    out = io.StringIO()
+    print("\n" + "=" * 60, file=out)
+    print("Integration with Response Methods Demo", file=out)
+    print("=" * 60, file=out)
     
     try:
-        # Initialize API client
-        api = OpenAIResponsesAPI()
-        
         # Create function tool
         calculator_tool = create_calculator_function_tool()
         
         # Example 1: Email with tool
-        print("\n1. Email Response with Tool")
-        print("-" * 30)
+        print("\n1. Email Response with Tool", file=out)
+        print("-" * 30, file=out)
         
-        response = api.create_email_response(
+        response = await api.create_email_response(
             prompt="Calculate the total cost for 5 items at $12.50 each and include it in a professional email to the client.",
             style="professional",
             tone="polite",
@@ -290,13 +304,13 @@ def demo_integration_with_response_methods():
             tool_choice="auto"
         )
         
-        print(f"Email Response: {response.content}")
+        print(f"Email Response: {response.content}", file=out)
         
         # Example 2: Letter with tool
-        print("\n2. Letter Response with Tool")
-        print("-" * 30)
+        print("\n2. Letter Response with Tool", file=out)
+        print("-" * 30, file=out)
         
-        response = api.create_letter_response(
+        response = await api.create_letter_response(
             prompt="Write a formal letter explaining the weather calculation for our outdoor event planning.",
             style="formal",
             tone="professional",
@@ -304,13 +318,13 @@ def demo_integration_with_response_methods():
             tool_choice="auto"
         )
         
-        print(f"Letter Response: {response.content}")
+        print(f"Letter Response: {response.content}", file=out)
         
         # Example 3: Message with tool
-        print("\n3. Message Response with Tool")
-        print("-" * 30)
+        print("\n3. Message Response with Tool", file=out)
+        print("-" * 30, file=out)
         
-        response = api.create_message_response(
+        response = await api.create_message_response(
             prompt="Send a friendly message to a friend with a quick calculation.",
             style="casual",
             tone="friendly",
@@ -318,10 +332,31 @@ def demo_integration_with_response_methods():
             tool_choice="auto"
         )
         
-        print(f"Message Response: {response.content}")
+        print(f"Message Response: {response.content}", file=out)
         
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    
+    return out.getvalue()
+
+
+async def run_demos() -> List[str]:
+    """Run the tool calling demos concurrently and return their output."""
+    from openai_responses import AsyncOpenAIResponsesAPI
+    
+    # One client for every demo, so they share its pooled connections
+    try:
+        api = AsyncOpenAIResponsesAPI()
+    except Exception as e:
+        return [f"Error: {e}\n"]
+    
+    async with api:
+        return await asyncio.gather(
+            demo_function_tools(api),
+            demo_hosted_tools(api),
+            demo_tool_choice_options(api),
+            demo_integration_with_response_methods(api),
+        )
 
 
 def main():
@@ -330,16 +365,13 @@ def main():
     print("This demo showcases function tools and hosted tools")
     
     # Check if API key is set
-    if not os.getenv("OPENAI_API_KEY"):
+    if not get_api_key():
         print("\n⚠️  Warning: OPENAI_API_KEY environment variable is not set.")
         print("   Set it with: export OPENAI_API_KEY='your-api-key-here'")
         print("   Some examples may fail without a valid API key.")
     
-    # Run demos
-    demo_function_tools()
-    demo_hosted_tools()
-    demo_tool_choice_options()
-    demo_integration_with_response_methods()
+    # Run demos concurrently, then print their buffered output in order
+    print("".join(asyncio.run(run_demos())), end="")
     
     print("\n" + "=" * 60)
     print("Demo Complete!")